@@ -302,18 +302,20 @@ class DatabaseController:
                 "errors": []
             }
 
-            for i, pan_file in enumerate(pan_files):
+            # Check which files should be skipped (new_only mode)
+            if new_only:
+                pan_files = [
+                    pan_file for pan_file in pan_files
+                    if not self.database.is_file_processed(str(pan_file))
+                ]
+
+            def insert(done, total, pan_file, parsing_result):
+                # Files are parsed in parallel; each is inserted as its result
+                # comes in, so a later failure doesn't lose earlier modules
                 try:
                     # Update progress
                     if progress_callback:
-                        progress_callback(i, len(pan_files), str(pan_file.name))
-
-                    # Check if file should be skipped (new_only mode)
-                    if new_only and self.database.is_file_processed(str(pan_file)):
-                        continue
-
-                    # Parse the file
-                    parsing_result = self.parser.parse_file(pan_file)
+                        progress_callback(done - 1, total, str(pan_file.name))
 
                     if parsing_result.success and parsing_result.module:
                         # Insert into database
@@ -340,6 +342,8 @@ class DatabaseController:
                     results["failed"] += 1
                     results["errors"].append(f"Error processing {pan_file.name}: {str(e)}")
 
+            self.parser.parse_directory(files=pan_files, progress_callback=insert)
+
             # Final progress update
             if progress_callback:
                 progress_callback(len(pan_files), len(pan_files), "Complete")
@@ -360,8 +364,7 @@ class DatabaseController:
             True if successful, False otherwise
         """
         try:
-            import shutil
-            shutil.copy2(self.db_path, backup_path)
+            self.database.backup(backup_path)
             return True
         except Exception as e:
             print(f"Error creating backup: {e}")
@@ -410,12 +413,13 @@ class DatabaseController:
                 return {"exists": False, "path": self.db_path}
 
             stat = db_file.stat()
+            size = self.database.file_size()
 
             return {
                 "exists": True,
                 "path": self.db_path,
-                "size_bytes": stat.st_size,
-                "size_mb": stat.st_size / (1024 * 1024),
+                "size_bytes": size,
+                "size_mb": size / (1024 * 1024),
                 "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
                 "created": datetime.fromtimestamp(stat.st_ctime).isoformat()
             }
@@ -14,9 +14,22 @@ __version__ = "0.1.0"
 __author__ = "PV PAN Tool Team"
 __email__ = "chinso@gmail.com"
 
-from .database import PVModuleDatabase
-from .models import ElectricalParameters, ManufacturerInfo, PhysicalParameters, PVModule
-from .parser import PANFileParser
+from importlib import import_module
+from typing import Any, List
+
+# Public names and the submodule defining each. They are imported on first
+# attribute access, so importing the package itself (as ``import
+# pv_pan_tool.cli`` does on the way to the CLI) doesn't load the models, the
+# parser and the database. Importing a submodule still loads everything that
+# submodule imports, e.g. ``pv_pan_tool.models`` loads pydantic.
+_LAZY_EXPORTS = {
+    "PVModule": "models",
+    "ElectricalParameters": "models",
+    "PhysicalParameters": "models",
+    "ManufacturerInfo": "models",
+    "PANFileParser": "parser",
+    "PVModuleDatabase": "database",
+}
 
 __all__ = [
     "PVModule",
@@ -26,3 +39,15 @@ __all__ = [
     "PANFileParser",
     "PVModuleDatabase",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(f".{_LAZY_EXPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
@@ -18,6 +18,9 @@ from ..utils.formatters import format_comparison_table, format_csv, format_json
 
 console = Console()
 
+# Characters of raw .PAN data shown by the details command
+RAW_PREVIEW_CHARS = 1000
+
 
 @click.command()
 @click.option(
@@ -526,12 +529,29 @@ Parsed At: {module.get('parsed_at', 'N/A')}
         raw_data = db.get_raw_pan_data(module.get('id'))
         if raw_data:
             raw_panel = Panel(
-                raw_data[:1000] + "..." if len(raw_data) > 1000 else raw_data,
-                title="Raw .PAN File Data (first 1000 chars)",
+                raw_pan_preview(raw_data),
+                title=f"Raw .PAN File Data (first {RAW_PREVIEW_CHARS} chars)",
                 border_style="dim"
             )
             console.print(raw_panel)
 
 
+def raw_pan_preview(raw_data, limit=RAW_PREVIEW_CHARS):
+    """Render raw .PAN key/value data as "key = value" lines, cut at limit characters.
+
+    Lines are only formatted until the limit is reached, so a large module's
+    raw data is never rendered in full just to be truncated.
+    """
+    lines = []
+    length = -1  # no newline before the first line
+    for key, value in raw_data.items():
+        line = f"{key} = {value}"
+        lines.append(line)
+        length += len(line) + 1
+        if length > limit:
+            return "\n".join(lines)[:limit] + "..."
+    return "\n".join(lines)
+
+
 # Remove the problematic line at the end
 # compare.add_command(details, name="details")
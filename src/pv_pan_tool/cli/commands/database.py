@@ -48,7 +48,7 @@ def info(ctx):
         
         # Database file information
         if db_file.exists():
-            file_size = db_file.stat().st_size
+            file_size = PVModuleDatabase(str(db_path)).file_size()
             modified_time = datetime.fromtimestamp(db_file.stat().st_mtime)
             
             file_info = f"""
@@ -143,19 +143,25 @@ def backup(ctx, output, compress):
         console.print(f"[blue]Source:[/blue] {db_path}")
         console.print(f"[blue]Destination:[/blue] {output}")
         
-        # Create backup
+        # Create backup through SQLite, so commits still in the -wal file are included
+        db = PVModuleDatabase(str(db_path))
         if compress:
             import gzip
-            with open(db_file, 'rb') as f_in:
-                with gzip.open(output, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+            snapshot = output.with_name(output.name + ".tmp")
+            try:
+                db.backup(snapshot)
+                with open(snapshot, 'rb') as f_in:
+                    with gzip.open(output, 'wb') as f_out:
+                        shutil.copyfileobj(f_in, f_out)
+            finally:
+                snapshot.unlink(missing_ok=True)
         else:
-            shutil.copy2(db_file, output)
+            db.backup(output)
         
         # Verify backup
         if output.exists():
             backup_size = output.stat().st_size
-            original_size = db_file.stat().st_size
+            original_size = db.file_size()
             
             success_info = f"""
 Backup created successfully!
@@ -228,19 +234,25 @@ def restore(ctx, input_file, force):
         console.print(f"[blue]Source:[/blue] {input_file}")
         console.print(f"[blue]Destination:[/blue] {db_path}")
         
-        # Restore from backup
+        # Restore through SQLite into the live database, so no stale -wal
+        # file is replayed onto the restored copy
+        db = PVModuleDatabase(str(db_path))
         if input_file.suffix == '.gz':
             import gzip
-            with gzip.open(input_file, 'rb') as f_in:
-                with open(db_file, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+            snapshot = db_file.with_name(db_file.name + ".restore.tmp")
+            try:
+                with gzip.open(input_file, 'rb') as f_in:
+                    with open(snapshot, 'wb') as f_out:
+                        shutil.copyfileobj(f_in, f_out)
+                db.restore(snapshot)
+            finally:
+                snapshot.unlink(missing_ok=True)
         else:
-            shutil.copy2(input_file, db_file)
+            db.restore(input_file)
         
         # Verify restore
         if db_file.exists():
             # Test database integrity
-            db = PVModuleDatabase(str(db_path))
             stats = db.get_statistics()
             
             success_info = f"""
@@ -426,7 +438,8 @@ def show_table_info(db):
         for table_data in table_info:
             table.add_row(
                 table_data.get('name', ''),
-                str(table_data.get('row_count', 0)),
+                # Counts from SQLite's planner statistics can lag behind writes
+                ("~" if table_data.get('estimated') else "") + str(table_data.get('row_count', 0)),
                 format_file_size(table_data.get('size_bytes', 0))
             )
         
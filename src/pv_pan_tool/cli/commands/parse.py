@@ -157,8 +157,6 @@ def parse(ctx, input_dir, max_files, new_only, force, output_db, dry_run):
 
 def parse_files_with_progress(parser, files_to_process, verbose):
     """Parse files with a progress bar."""
-    results = {}
-
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -169,24 +167,16 @@ def parse_files_with_progress(parser, files_to_process, verbose):
 
         task = progress.add_task("Parsing files...", total=len(files_to_process))
 
-        for i, file_path in enumerate(files_to_process):
-            if verbose:
-                progress.update(task, description=f"Parsing {file_path.name}")
-
-            try:
-                result = parser.parse_file(file_path)
-                results[str(file_path)] = result
+        def report(done, total, file_path, result):
+            if verbose and result.success:
+                console.print(f"[green]✓[/green] {file_path.name}")
+            elif verbose:
+                console.print(f"[red]✗[/red] {file_path.name}: {result.error_message}")
 
-                if verbose and result.success:
-                    console.print(f"[green]✓[/green] {file_path.name}")
-                elif verbose:
-                    console.print(f"[red]✗[/red] {file_path.name}: {result.error_message}")
+            progress.update(task, completed=done)
 
-            except Exception as e:
-                if verbose:
-                    console.print(f"[red]✗[/red] {file_path.name}: {e}")
-
-            progress.update(task, advance=1)
+        # Parsed in parallel; results come back in files_to_process order
+        results = parser.parse_directory(files=files_to_process, progress_callback=report)
 
     return results
 
@@ -0,0 +1,34 @@
+"""
+SQLite connection setup shared by the module database and the parsed-files registry.
+
+Kept apart from the database module so the registry (and through it the
+parser) can open connections without importing the database layer.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Union
+
+# Applied once to every connection opened by PVModuleDatabase
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def open_connection(db_path: Union[str, Path], pragmas: Iterable[str] = CONNECTION_PRAGMAS,
+                    **kwargs: Any) -> sqlite3.Connection:
+    """
+    Open an SQLite connection usable from any thread, with pragmas applied.
+
+    The 30-second busy timeout makes a reader or second writer wait for the
+    current WAL writer instead of failing with "database is locked". Extra
+    keyword arguments go to sqlite3.connect.
+    """
+    conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False, **kwargs)
+    for pragma in pragmas:
+        conn.execute(pragma)
+    return conn
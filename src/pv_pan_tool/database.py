@@ -5,14 +5,161 @@ This module provides functionality to store, query, and manage
 PV module data in a SQLite database.
 """
 
+import atexit
 import json
+import queue
 import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from .connection import open_connection
 from .models import ParsingResult, PVModule
 
+# Re-run ANALYZE after an ingest once pv_modules' row count has moved by more
+# than this fraction of the count its planner statistics were taken at
+ANALYZE_CHANGE_RATIO = 0.2
+
+# Conservative bound on host parameters per statement (SQLITE_MAX_VARIABLE_NUMBER)
+MAX_SQL_VARIABLES = 999
+
+# Efficiency histogram statements for the automatically chosen bin sizes
+EFFICIENCY_BIN_QUERIES = {
+    bin_size: f"""
+        SELECT CAST(efficiency_stc * {int(1 / bin_size)} AS INTEGER), COUNT(*)
+        FROM pv_modules
+        WHERE efficiency_stc IS NOT NULL
+        GROUP BY 1
+    """
+    for bin_size in (0.25, 0.5, 1.0)
+}
+
+_SQL_INSERT_MODULE = """
+    INSERT INTO pv_modules (
+        unique_id, manufacturer, model, series,
+        pmax_stc, vmp_stc, imp_stc, voc_stc, isc_stc,
+        temp_coeff_pmax, temp_coeff_voc, temp_coeff_isc,
+        noct, max_system_voltage,
+        height, width, thickness, weight,
+        cells_in_series, cells_in_parallel, total_cells,
+        cell_type, module_type,
+        efficiency_stc, power_density, area_m2,
+        file_path, file_name, file_size, file_hash,
+        manufacturer_folder, model_folder,
+        parsed_at, parser_version, raw_pan_json, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Insert a module or, if its unique_id is already stored, update it in place
+# (keeping id and created_at) and return the row id either way
+_SQL_UPSERT_MODULE = _SQL_INSERT_MODULE + """
+    ON CONFLICT(unique_id) DO UPDATE SET
+        manufacturer = excluded.manufacturer, model = excluded.model, series = excluded.series,
+        pmax_stc = excluded.pmax_stc, vmp_stc = excluded.vmp_stc, imp_stc = excluded.imp_stc, voc_stc = excluded.voc_stc, isc_stc = excluded.isc_stc,
+        temp_coeff_pmax = excluded.temp_coeff_pmax, temp_coeff_voc = excluded.temp_coeff_voc, temp_coeff_isc = excluded.temp_coeff_isc,
+        noct = excluded.noct, max_system_voltage = excluded.max_system_voltage,
+        height = excluded.height, width = excluded.width, thickness = excluded.thickness, weight = excluded.weight,
+        cells_in_series = excluded.cells_in_series, cells_in_parallel = excluded.cells_in_parallel, total_cells = excluded.total_cells,
+        cell_type = excluded.cell_type, module_type = excluded.module_type,
+        efficiency_stc = excluded.efficiency_stc, power_density = excluded.power_density, area_m2 = excluded.area_m2,
+        file_path = excluded.file_path, file_name = excluded.file_name, file_size = excluded.file_size, file_hash = excluded.file_hash,
+        manufacturer_folder = excluded.manufacturer_folder, model_folder = excluded.model_folder,
+        parsed_at = excluded.parsed_at, parser_version = excluded.parser_version,
+        raw_pan_json = excluded.raw_pan_json, updated_at = excluded.updated_at
+    RETURNING id
+"""
+
+_SQL_INSERT_MODULE_IF_NEW = _SQL_INSERT_MODULE + """
+    ON CONFLICT(unique_id) DO NOTHING
+    RETURNING id
+"""
+
+_SQL_UPDATE_MODULE = """
+    UPDATE pv_modules SET
+        manufacturer = ?, model = ?, series = ?,
+        pmax_stc = ?, vmp_stc = ?, imp_stc = ?, voc_stc = ?, isc_stc = ?,
+        temp_coeff_pmax = ?, temp_coeff_voc = ?, temp_coeff_isc = ?,
+        noct = ?, max_system_voltage = ?,
+        height = ?, width = ?, thickness = ?, weight = ?,
+        cells_in_series = ?, cells_in_parallel = ?, total_cells = ?,
+        cell_type = ?, module_type = ?,
+        efficiency_stc = ?, power_density = ?, area_m2 = ?,
+        file_path = ?, file_name = ?, file_size = ?, file_hash = ?,
+        manufacturer_folder = ?, model_folder = ?,
+        parsed_at = ?, parser_version = ?, raw_pan_json = ?, updated_at = ?
+    WHERE id = ?
+"""
+
+_SQL_INSERT_CERTIFICATION = """
+    INSERT INTO certifications (module_id, certification_name, certified)
+    VALUES (?, ?, ?)
+"""
+
+# pv_modules columns returned by module lookups, searches and exports
+_MODULE_COLS = """
+    id, unique_id, manufacturer, model, series,
+    pmax_stc, vmp_stc, imp_stc, voc_stc, isc_stc,
+    temp_coeff_pmax, temp_coeff_voc, temp_coeff_isc,
+    noct, max_system_voltage,
+    height, width, thickness, weight,
+    cells_in_series, cells_in_parallel, total_cells,
+    cell_type, module_type,
+    efficiency_stc, power_density, area_m2,
+    file_path, file_name, file_size, file_hash,
+    manufacturer_folder, model_folder,
+    parsed_at, parser_version, created_at, updated_at
+"""
+
+_SQL_MODULE_EXISTS = "SELECT 1 FROM pv_modules WHERE unique_id = ? LIMIT 1"
+
+_SQL_FILE_PROCESSED = "SELECT 1 FROM pv_modules WHERE file_path = ? LIMIT 1"
+
+_SQL_MODULE_ID = "SELECT id FROM pv_modules WHERE unique_id = ?"
+
+_SQL_SELECT_MODULE = f"SELECT {_MODULE_COLS} FROM pv_modules WHERE id = ?"
+
+_SQL_DELETE_CERTIFICATIONS = "DELETE FROM certifications WHERE module_id = ?"
+
+_SQL_DELETE_RAW_DATA = "DELETE FROM raw_pan_data WHERE module_id = ?"
+
+# Keys of the pv_modules_stats roll-up, in _SQL_STATS_AGGREGATE column order
+STATS_KEYS = (
+    "total_modules", "total_manufacturers", "total_models",
+    "min_power", "max_power", "avg_power",
+    "min_efficiency", "max_efficiency", "avg_efficiency",
+)
+
+_SQL_STATS_AGGREGATE = """
+    SELECT
+        COUNT(*), COUNT(DISTINCT manufacturer), COUNT(DISTINCT model),
+        MIN(pmax_stc), MAX(pmax_stc), AVG(pmax_stc),
+        MIN(efficiency_stc), MAX(efficiency_stc), AVG(efficiency_stc)
+    FROM pv_modules
+"""
+
+_SQL_STATS_CELL_TYPES = "SELECT COALESCE(cell_type, 'unknown'), COUNT(*) FROM pv_modules GROUP BY 1"
+
+# Results written per transaction when bulk inserting from an iterable
+BULK_BATCH_SIZE = 1000
+
+# Rows fetched from SQLite per step when streaming search results
+SEARCH_FETCH_SIZE = 1000
+
+# Idle read connections kept open per database; extra ones are closed on return
+READ_POOL_SIZE = 4
+
+_open_databases: "weakref.WeakSet[PVModuleDatabase]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_databases() -> None:
+    """Close pooled connections of any database still alive at interpreter exit."""
+    for database in list(_open_databases):
+        database.close()
+
 
 class PVModuleDatabase:
     """Database manager for PV module specifications."""
@@ -26,8 +173,69 @@ class PVModuleDatabase:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.RLock()
+        self._read_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=READ_POOL_SIZE)
+        self._ranges_cache: Optional[Tuple[sqlite3.Connection, int, Dict[str, Optional[float]]]] = None
+        _open_databases.add(self)
         self.init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with the standard PRAGMAs applied."""
+        # Keep enough prepared statements cached for every fixed query below
+        conn = open_connection(self.db_path, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection from the read pool, opening one if none is idle."""
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            try:
+                self._read_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Hold the single write connection for one transaction."""
+        with self._write_lock:
+            if self._write_conn is None:
+                self._write_conn = self._connect()
+            with self._write_conn as conn:
+                yield conn
+
+    def close(self) -> None:
+        """Close the write connection and every idle pooled read connection."""
+        with self._write_lock:
+            if self._write_conn is not None:
+                # Let SQLite refresh any statistics it found worth updating
+                try:
+                    self._write_conn.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+                self._write_conn.close()
+                self._write_conn = None
+        self._ranges_cache = None
+        while True:
+            try:
+                conn = self._read_pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def _normalize_value(self, value):
         """Helper method to convert list values to strings for database compatibility."""
         if isinstance(value, list):
@@ -36,7 +244,7 @@ class PVModuleDatabase:
 
     def init_database(self) -> None:
         """Initialize the database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write() as conn:
             cursor = conn.cursor()
 
             # Create main modules table
@@ -95,6 +303,7 @@ class PVModuleDatabase:
                     -- Processing metadata
                     parsed_at TEXT NOT NULL,
                     parser_version TEXT,
+                    raw_pan_json TEXT,
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP,
                     updated_at TEXT DEFAULT CURRENT_TIMESTAMP
                 )
@@ -111,7 +320,26 @@ class PVModuleDatabase:
                 )
             """)
 
-            # Create raw data table for storing original .PAN content
+            # Databases created before raw .PAN data moved into pv_modules
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(pv_modules)")}
+            if "raw_pan_json" not in columns:
+                cursor.execute("ALTER TABLE pv_modules ADD COLUMN raw_pan_json TEXT")
+
+            # Roll-up of get_statistics, rebuilt by bulk ingests; empty means stale
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS pv_modules_stats (
+                    k TEXT PRIMARY KEY,
+                    v REAL
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS pv_modules_stats_cell_type (
+                    cell_type TEXT PRIMARY KEY,
+                    count INTEGER
+                )
+            """)
+
+            # Legacy per-parameter raw data, read only for modules without raw_pan_json
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS raw_pan_data (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -123,38 +351,108 @@ class PVModuleDatabase:
             """)
 
             # Create indexes for better query performance
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_manufacturer ON pv_modules (manufacturer)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_model ON pv_modules (model)")
+            # (manufacturer, model) serves manufacturer/model listings as index-only scans
+            cursor.execute("DROP INDEX IF EXISTS idx_manufacturer")
+            cursor.execute("DROP INDEX IF EXISTS idx_model")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mfr_model ON pv_modules (manufacturer, model)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_pmax ON pv_modules (pmax_stc)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_efficiency ON pv_modules (efficiency_stc)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_cell_type ON pv_modules (cell_type)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_unique_id ON pv_modules (unique_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_file_hash ON pv_modules (file_hash)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mfr_power ON pv_modules (manufacturer, pmax_stc DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_celltype_eff ON pv_modules (cell_type, efficiency_stc DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_cert_module ON certifications (module_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_rawpan_module ON raw_pan_data (module_id, parameter_name)")
 
             conn.commit()
 
     def module_exists(self, unique_id: str) -> bool:
         """Check if a module with the given unique_id already exists."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM pv_modules WHERE unique_id = ?", (unique_id,))
-            return cursor.fetchone()[0] > 0
+            cursor.execute(_SQL_MODULE_EXISTS, (unique_id,))
+            return cursor.fetchone() is not None
 
     def is_file_processed(self, file_path: str) -> bool:
         """Return True if a module with the given file path already exists in DB."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM pv_modules WHERE file_path = ?", (str(file_path),))
-            return cursor.fetchone()[0] > 0
+            cursor.execute(_SQL_FILE_PROCESSED, (str(file_path),))
+            return cursor.fetchone() is not None
 
     def get_module_id_by_unique_id(self, unique_id: str) -> Optional[int]:
         """Get the database ID of a module by its unique_id."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT id FROM pv_modules WHERE unique_id = ?", (unique_id,))
+            cursor.execute(_SQL_MODULE_ID, (unique_id,))
             result = cursor.fetchone()
             return result[0] if result else None
 
+    def _calculate_derived_values(self, module: PVModule) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """Return (efficiency %, power density W/m², area m²) for a module, or Nones."""
+        pmax = module.electrical_params.pmax_stc
+        height = module.physical_params.height
+        width = module.physical_params.width
+        # Values are numeric after parsing; anything else (None, zero or an
+        # unparsed string) has no derived values
+        if not (isinstance(pmax, (int, float)) and isinstance(height, (int, float))
+                and isinstance(width, (int, float)) and pmax and height and width):
+            return None, None, None
+
+        area_m2 = (height * width) / 1_000_000  # mm² to m²
+        efficiency = (pmax / (area_m2 * 1000)) * 100  # Efficiency %
+        power_density = pmax / area_m2  # W/m²
+        return efficiency, power_density, area_m2
+
+    def _module_values(self, module: PVModule, timestamp: str) -> Tuple[Any, ...]:
+        """Build the pv_modules values for a module in _SQL_INSERT_MODULE column order."""
+        efficiency, power_density, area_m2 = self._calculate_derived_values(module)
+        return (
+            module.unique_id,
+            self._normalize_value(module.manufacturer_info.name),
+            module.manufacturer_info.model,
+            module.manufacturer_info.series,
+            module.electrical_params.pmax_stc,
+            module.electrical_params.vmp_stc,
+            module.electrical_params.imp_stc,
+            module.electrical_params.voc_stc,
+            module.electrical_params.isc_stc,
+            module.electrical_params.temp_coeff_pmax,
+            module.electrical_params.temp_coeff_voc,
+            module.electrical_params.temp_coeff_isc,
+            module.electrical_params.noct,
+            module.electrical_params.max_system_voltage,
+            module.physical_params.height,
+            module.physical_params.width,
+            module.physical_params.thickness,
+            module.physical_params.weight,
+            module.physical_params.cells_in_series,
+            module.physical_params.cells_in_parallel,
+            module.physical_params.total_cells,
+            module.cell_type,
+            module.module_type,
+            efficiency,
+            power_density,
+            area_m2,
+            str(module.file_metadata.file_path),
+            module.file_metadata.file_name,
+            module.file_metadata.file_size,
+            module.file_metadata.file_hash,
+            module.file_metadata.manufacturer_folder,
+            module.file_metadata.model_folder,
+            module.file_metadata.parsed_at.isoformat(),
+            module.file_metadata.parser_version,
+            self._raw_pan_json(module.raw_data),
+            timestamp,
+            timestamp
+        )
+
+    def _update_values(self, module_id: int, values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """Turn _module_values output into _SQL_UPDATE_MODULE parameters."""
+        # Drop unique_id and created_at; keep updated_at and target the row id
+        return values[1:-2] + (values[-1], module_id)
+
     def insert_module(self, module: PVModule, update_if_exists: bool = True) -> Optional[int]:
         """
         Insert a PV module into the database.
@@ -166,239 +464,242 @@ class PVModuleDatabase:
         Returns:
             ID of the inserted/updated module, or None if skipped
         """
-        # Check if module already exists
-        if self.module_exists(module.unique_id):
-            if update_if_exists:
-                print(f"Module {module.unique_id} already exists, updating...")
-                return self.update_module(module)
-            else:
-                print(f"Module {module.unique_id} already exists, skipping...")
-                return self.get_module_id_by_unique_id(module.unique_id)
+        values = self._module_values(module, datetime.now().isoformat())
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write() as conn:
             cursor = conn.cursor()
 
-            # Calculate derived values
-            efficiency = None
-            power_density = None
-            area_m2 = None
-
-            if (module.electrical_params.pmax_stc and
-                module.physical_params.height and
-                module.physical_params.width):
-                try:
-                    height = float(module.physical_params.height)
-                    width = float(module.physical_params.width)
-                    pmax = float(module.electrical_params.pmax_stc)
-
-                    area_m2 = (height * width) / 1_000_000  # mm² to m²
-                    efficiency = (pmax / (area_m2 * 1000)) * 100  # Efficiency %
-                    power_density = pmax / area_m2  # W/m²
-                except (ValueError, TypeError, ZeroDivisionError):
-                    pass
-
-            # Get current timestamp
-            current_time = datetime.now().isoformat()
-
-            # Insert main module data
-            cursor.execute("""
-                INSERT INTO pv_modules (
-                    unique_id, manufacturer, model, series,
-                    pmax_stc, vmp_stc, imp_stc, voc_stc, isc_stc,
-                    temp_coeff_pmax, temp_coeff_voc, temp_coeff_isc,
-                    noct, max_system_voltage,
-                    height, width, thickness, weight,
-                    cells_in_series, cells_in_parallel, total_cells,
-                    cell_type, module_type,
-                    efficiency_stc, power_density, area_m2,
-                    file_path, file_name, file_size, file_hash,
-                    manufacturer_folder, model_folder,
-                    parsed_at, parser_version, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                module.unique_id,
-                self._normalize_value(module.manufacturer_info.name),
-                module.manufacturer_info.model,
-                module.manufacturer_info.series,
-                module.electrical_params.pmax_stc,
-                module.electrical_params.vmp_stc,
-                module.electrical_params.imp_stc,
-                module.electrical_params.voc_stc,
-                module.electrical_params.isc_stc,
-                module.electrical_params.temp_coeff_pmax,
-                module.electrical_params.temp_coeff_voc,
-                module.electrical_params.temp_coeff_isc,
-                module.electrical_params.noct,
-                module.electrical_params.max_system_voltage,
-                module.physical_params.height,
-                module.physical_params.width,
-                module.physical_params.thickness,
-                module.physical_params.weight,
-                module.physical_params.cells_in_series,
-                module.physical_params.cells_in_parallel,
-                module.physical_params.total_cells,
-                module.cell_type.value,
-                module.module_type.value,
-                efficiency,
-                power_density,
-                area_m2,
-                str(module.file_metadata.file_path),
-                module.file_metadata.file_name,
-                module.file_metadata.file_size,
-                module.file_metadata.file_hash,
-                module.file_metadata.manufacturer_folder,
-                module.file_metadata.model_folder,
-                module.file_metadata.parsed_at.isoformat(),
-                module.file_metadata.parser_version,
-                current_time,
-                current_time
-            ))
+            if update_if_exists:
+                module_id = cursor.execute(_SQL_UPSERT_MODULE, values).fetchone()[0]
 
-            module_id = cursor.lastrowid
+                # Replace related data left over from a previous version of the module,
+                # including any legacy raw_pan_data rows
+                cursor.execute(_SQL_DELETE_CERTIFICATIONS, (module_id,))
+                cursor.execute(_SQL_DELETE_RAW_DATA, (module_id,))
+            else:
+                row = cursor.execute(_SQL_INSERT_MODULE_IF_NEW, values).fetchone()
+                if row is None:
+                    print(f"Module {module.unique_id} already exists, skipping...")
+                    cursor.execute(_SQL_MODULE_ID, (module.unique_id,))
+                    return cursor.fetchone()[0]
+                module_id = row[0]
 
             # Insert related data
             self._insert_certifications(cursor, module_id, module.certification_info)
-            self._insert_raw_data(cursor, module_id, module.raw_data)
 
-            conn.commit()
+            # Rebuilding the roll-up per module would rescan the table on every
+            # insert; mark it stale so get_statistics aggregates directly
+            cursor.execute("DELETE FROM pv_modules_stats")
+
             return module_id
 
     def update_module(self, module: PVModule) -> Optional[int]:
         """Update an existing module in the database."""
-        module_id = self.get_module_id_by_unique_id(module.unique_id)
-        if not module_id:
+        if not self.module_exists(module.unique_id):
             return None
+        return self.insert_module(module)
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Calculate derived values
-            efficiency = None
-            power_density = None
-            area_m2 = None
-
-            if (module.electrical_params.pmax_stc and
-                module.physical_params.height and
-                module.physical_params.width):
-                try:
-                    height = float(module.physical_params.height)
-                    width = float(module.physical_params.width)
-                    pmax = float(module.electrical_params.pmax_stc)
-
-                    area_m2 = (height * width) / 1_000_000  # mm² to m²
-                    efficiency = (pmax / (area_m2 * 1000)) * 100  # Efficiency %
-                    power_density = pmax / area_m2  # W/m²
-                except (ValueError, TypeError, ZeroDivisionError):
-                    pass
-
-            # Update main module data
-            cursor.execute("""
-                UPDATE pv_modules SET
-                    manufacturer = ?, model = ?, series = ?,
-                    pmax_stc = ?, vmp_stc = ?, imp_stc = ?, voc_stc = ?, isc_stc = ?,
-                    temp_coeff_pmax = ?, temp_coeff_voc = ?, temp_coeff_isc = ?,
-                    noct = ?, max_system_voltage = ?,
-                    height = ?, width = ?, thickness = ?, weight = ?,
-                    cells_in_series = ?, cells_in_parallel = ?, total_cells = ?,
-                    cell_type = ?, module_type = ?,
-                    efficiency_stc = ?, power_density = ?, area_m2 = ?,
-                    file_path = ?, file_name = ?, file_size = ?, file_hash = ?,
-                    manufacturer_folder = ?, model_folder = ?,
-                    parsed_at = ?, parser_version = ?, updated_at = ?
-                WHERE id = ?
-            """, (
-                self._normalize_value(module.manufacturer_info.name),
-                module.manufacturer_info.model,
-                module.manufacturer_info.series,
-                module.electrical_params.pmax_stc,
-                module.electrical_params.vmp_stc,
-                module.electrical_params.imp_stc,
-                module.electrical_params.voc_stc,
-                module.electrical_params.isc_stc,
-                module.electrical_params.temp_coeff_pmax,
-                module.electrical_params.temp_coeff_voc,
-                module.electrical_params.temp_coeff_isc,
-                module.electrical_params.noct,
-                module.electrical_params.max_system_voltage,
-                module.physical_params.height,
-                module.physical_params.width,
-                module.physical_params.thickness,
-                module.physical_params.weight,
-                module.physical_params.cells_in_series,
-                module.physical_params.cells_in_parallel,
-                module.physical_params.total_cells,
-                module.cell_type.value,
-                module.module_type.value,
-                efficiency,
-                power_density,
-                area_m2,
-                str(module.file_metadata.file_path),
-                module.file_metadata.file_name,
-                module.file_metadata.file_size,
-                module.file_metadata.file_hash,
-                module.file_metadata.manufacturer_folder,
-                module.file_metadata.model_folder,
-                module.file_metadata.parsed_at.isoformat(),
-                module.file_metadata.parser_version,
-                datetime.now().isoformat(),
-                module_id
-            ))
+    def _bulk_write_modules(self, new_modules: List[Tuple[str, PVModule]],
+                            updates: List[Tuple[str, PVModule]]) -> Tuple[int, int]:
+        """
+        Insert new modules and update existing ones in a single transaction.
 
-            # Delete and re-insert related data
-            cursor.execute("DELETE FROM certifications WHERE module_id = ?", (module_id,))
-            cursor.execute("DELETE FROM raw_pan_data WHERE module_id = ?", (module_id,))
+        Every table is written with executemany. Modules in ``updates`` are
+        applied after the inserts, so a module repeated within the batch ends
+        up with its last copy's values.
 
-            self._insert_certifications(cursor, module_id, module.certification_info)
-            self._insert_raw_data(cursor, module_id, module.raw_data)
-
-            conn.commit()
-            return module_id
+        Returns:
+            Tuple of (inserted, updated) counts
+        """
+        timestamp = datetime.now().isoformat()
+        with self._write() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN")
 
-    def _insert_certifications(self, cursor, module_id: int, certification_info) -> None:
-        """Helper method to insert certifications."""
+            changes_before = conn.total_changes
+            cursor.executemany(
+                _SQL_INSERT_MODULE,
+                (self._module_values(module, timestamp) for _, module in new_modules),
+            )
+            inserted = conn.total_changes - changes_before
+
+            # Resolve ids for every module touched by this batch
+            unique_ids = list({module.unique_id for _, module in new_modules + updates})
+            module_ids: Dict[str, int] = {}
+            for i in range(0, len(unique_ids), MAX_SQL_VARIABLES):
+                chunk = unique_ids[i:i + MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT unique_id, id FROM pv_modules WHERE unique_id IN ({placeholders})", chunk
+                )
+                module_ids.update(cursor.fetchall())
+
+            if updates:
+                cursor.executemany(
+                    _SQL_UPDATE_MODULE,
+                    (
+                        self._update_values(module_ids[module.unique_id], self._module_values(module, timestamp))
+                        for _, module in updates
+                    ),
+                )
+                stale_ids = [(module_ids[module.unique_id],) for _, module in updates]
+                cursor.executemany(_SQL_DELETE_CERTIFICATIONS, stale_ids)
+                cursor.executemany(_SQL_DELETE_RAW_DATA, stale_ids)
+
+            # Related rows come from the last copy of each module
+            final_modules = {module_ids[module.unique_id]: module for _, module in new_modules + updates}
+            cert_rows: List[Tuple[int, str, bool]] = []
+            for module_id, module in final_modules.items():
+                cert_rows.extend(self._certification_rows(module_id, module.certification_info))
+            cursor.executemany(_SQL_INSERT_CERTIFICATION, cert_rows)
+
+            # Mark the roll-up stale; it is rebuilt once when the ingest finishes
+            cursor.execute("DELETE FROM pv_modules_stats")
+
+        return inserted, len(updates)
+
+    def _finish_bulk_ingest(self) -> None:
+        """Run the once-per-ingest maintenance after the last batch is written."""
+        with self._write() as conn:
+            # Refresh planner statistics so filtered searches pick the right
+            # index, but only when the table has changed size enough to matter
+            if self._planner_stats_stale(conn):
+                conn.execute("ANALYZE pv_modules")
+            self._refresh_stats(conn.cursor())
+
+    def _planner_stats_stale(self, conn: sqlite3.Connection) -> bool:
+        """Whether pv_modules has no statistics or its row count has drifted from them."""
+        try:
+            row = conn.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = 'pv_modules' LIMIT 1").fetchone()
+        except sqlite3.OperationalError:
+            return True  # Never analyzed: no sqlite_stat1 table yet
+        if not row or not row[0]:
+            return True
+        # Every sqlite_stat1 row starts with the row count of its table
+        analyzed = int(row[0].split()[0])
+        count = conn.execute("SELECT COUNT(*) FROM pv_modules").fetchone()[0]
+        return abs(count - analyzed) > ANALYZE_CHANGE_RATIO * analyzed
+
+    def _certification_rows(self, module_id: int, certification_info) -> List[Tuple[int, str, bool]]:
+        """Build certifications rows for a module."""
         cert_data = [
             ("IEC 61215", certification_info.iec_61215),
             ("IEC 61730", certification_info.iec_61730),
             ("UL Listed", certification_info.ul_listed),
             ("CE Marking", certification_info.ce_marking),
         ]
+        rows = [(module_id, cert_name, certified) for cert_name, certified in cert_data if certified is not None]
 
-        for cert_name, certified in cert_data:
-            if certified is not None:
-                cursor.execute("""
-                    INSERT INTO certifications (module_id, certification_name, certified)
-                    VALUES (?, ?, ?)
-                """, (module_id, cert_name, certified))
-
-        # Insert additional certifications
+        # Additional certifications
         if certification_info.certifications:
-            for cert in certification_info.certifications:
-                cursor.execute("""
-                    INSERT INTO certifications (module_id, certification_name, certified)
-                    VALUES (?, ?, ?)
-                """, (module_id, cert, True))
-
-    def _insert_raw_data(self, cursor, module_id: int, raw_pan_data: dict) -> None:
-        """Helper method to insert raw PAN data."""
-        for key, value in raw_pan_data.items():
-            cursor.execute("""
-                INSERT INTO raw_pan_data (module_id, parameter_name, parameter_value)
-                VALUES (?, ?, ?)
-            """, (module_id, key, str(value)))
+            rows.extend((module_id, cert, True) for cert in certification_info.certifications)
+        return rows
+
+    def _raw_pan_json(self, raw_pan_data: dict) -> str:
+        """Serialize raw .PAN key/value data for the raw_pan_json column."""
+        return json.dumps({key: str(value) for key, value in raw_pan_data.items()}, separators=(",", ":"))
+
+    def _insert_certifications(self, cursor, module_id: int, certification_info) -> None:
+        """Helper method to insert certifications."""
+        cursor.executemany(_SQL_INSERT_CERTIFICATION, self._certification_rows(module_id, certification_info))
 
     def get_module_by_id(self, module_id: int) -> Optional[Dict]:
         """Get a module by its database ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT * FROM pv_modules WHERE id = ?", (module_id,))
+            cursor.execute(_SQL_SELECT_MODULE, (module_id,))
             row = cursor.fetchone()
 
             if row:
                 return dict(row)
             return None
 
+    def _build_search_query(self,
+                            manufacturer: Optional[str] = None,
+                            model: Optional[str] = None,
+                            min_power: Optional[float] = None,
+                            max_power: Optional[float] = None,
+                            min_efficiency: Optional[float] = None,
+                            max_efficiency: Optional[float] = None,
+                            cell_type: Optional[str] = None,
+                            module_type: Optional[str] = None,
+                            min_height: Optional[float] = None,
+                            max_height: Optional[float] = None,
+                            min_width: Optional[float] = None,
+                            max_width: Optional[float] = None,
+                            sort_by: Optional[str] = None,
+                            sort_order: str = "desc",
+                            limit: Optional[int] = None) -> Tuple[str, List[Any]]:
+        """Build the SELECT statement and parameters shared by the search helpers."""
+        query = f"SELECT {_MODULE_COLS} FROM pv_modules WHERE 1=1"
+        params: List[Any] = []
+
+        if manufacturer:
+            query += " AND manufacturer LIKE ?"
+            params.append(f"%{manufacturer}%")
+
+        if model:
+            query += " AND model LIKE ?"
+            params.append(f"%{model}%")
+
+        if min_power is not None:
+            query += " AND pmax_stc >= ?"
+            params.append(min_power)
+
+        if max_power is not None:
+            query += " AND pmax_stc <= ?"
+            params.append(max_power)
+
+        if min_efficiency is not None:
+            query += " AND efficiency_stc >= ?"
+            params.append(min_efficiency)
+
+        if max_efficiency is not None:
+            query += " AND efficiency_stc <= ?"
+            params.append(max_efficiency)
+
+        if cell_type:
+            query += " AND cell_type = ?"
+            params.append(cell_type)
+
+        if module_type:
+            query += " AND module_type = ?"
+            params.append(module_type)
+
+        if min_height is not None:
+            query += " AND height >= ?"
+            params.append(min_height)
+
+        if max_height is not None:
+            query += " AND height <= ?"
+            params.append(max_height)
+
+        if min_width is not None:
+            query += " AND width >= ?"
+            params.append(min_width)
+
+        if max_width is not None:
+            query += " AND width <= ?"
+            params.append(max_width)
+
+        # Sorting (whitelist to avoid SQL injection)
+        allowed_sort = {
+            "pmax_stc", "efficiency_stc", "voc_stc", "isc_stc",
+            "vmp_stc", "imp_stc", "manufacturer", "model"
+        }
+        if sort_by in allowed_sort:
+            order = "DESC" if str(sort_order).lower() == "desc" else "ASC"
+            query += f" ORDER BY {sort_by} {order}"
+        else:
+            query += " ORDER BY pmax_stc DESC"
+
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        return query, params
+
     def search_modules(self,
                       manufacturer: Optional[str] = None,
                       model: Optional[str] = None,
@@ -435,103 +736,61 @@ class PVModuleDatabase:
         Returns:
             List of matching modules
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            query = "SELECT * FROM pv_modules WHERE 1=1"
-            params = []
-
-            if manufacturer:
-                query += " AND manufacturer LIKE ?"
-                params.append(f"%{manufacturer}%")
-
-            if model:
-                query += " AND model LIKE ?"
-                params.append(f"%{model}%")
-
-            if min_power is not None:
-                query += " AND pmax_stc >= ?"
-                params.append(min_power)
-
-            if max_power is not None:
-                query += " AND pmax_stc <= ?"
-                params.append(max_power)
-
-            if min_efficiency is not None:
-                query += " AND efficiency_stc >= ?"
-                params.append(min_efficiency)
-
-            if max_efficiency is not None:
-                query += " AND efficiency_stc <= ?"
-                params.append(max_efficiency)
-
-            if cell_type:
-                query += " AND cell_type = ?"
-                params.append(cell_type)
-
-            if module_type:
-                query += " AND module_type = ?"
-                params.append(module_type)
-
-            if min_height is not None:
-                query += " AND height >= ?"
-                params.append(min_height)
-
-            if max_height is not None:
-                query += " AND height <= ?"
-                params.append(max_height)
-
-            if min_width is not None:
-                query += " AND width >= ?"
-                params.append(min_width)
-
-            if max_width is not None:
-                query += " AND width <= ?"
-                params.append(max_width)
-
-            # Sorting (whitelist to avoid SQL injection)
-            allowed_sort = {
-                "pmax_stc", "efficiency_stc", "voc_stc", "isc_stc",
-                "vmp_stc", "imp_stc", "manufacturer", "model"
-            }
-            if sort_by in allowed_sort:
-                order = "DESC" if str(sort_order).lower() == "desc" else "ASC"
-                query += f" ORDER BY {sort_by} {order}"
-            else:
-                query += " ORDER BY pmax_stc DESC"
-
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
+        return list(self.search_modules_iter(
+            manufacturer=manufacturer, model=model,
+            min_power=min_power, max_power=max_power,
+            min_efficiency=min_efficiency, max_efficiency=max_efficiency,
+            cell_type=cell_type, module_type=module_type,
+            min_height=min_height, max_height=max_height,
+            min_width=min_width, max_width=max_width,
+            sort_by=sort_by, sort_order=sort_order, limit=limit,
+        ))
+
+    def search_modules_iter(self, **filters) -> Iterator[Dict]:
+        """
+        Lazily yield modules matching the given filters.
 
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+        Accepts the same keyword arguments as ``search_modules`` but walks the
+        cursor instead of materializing the full result set.
+        """
+        for row in self._search_iter(**filters):
+            yield dict(row)
+
+    def _search_iter(self, **filters) -> Iterator[sqlite3.Row]:
+        """Yield raw rows for a search, holding a pooled connection until exhausted."""
+        query, params = self._build_search_query(**filters)
+        with self._read() as conn:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(SEARCH_FETCH_SIZE)
+                if not rows:
+                    return
+                yield from rows
 
     def get_manufacturers(self) -> List[str]:
         """Get list of all manufacturers in the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT DISTINCT manufacturer FROM pv_modules ORDER BY manufacturer")
             return [row[0] for row in cursor.fetchall()]
 
     def get_cell_types(self) -> List[str]:
         """Get list of all cell types in the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT DISTINCT cell_type FROM pv_modules WHERE cell_type IS NOT NULL ORDER BY cell_type")
             return [row[0] for row in cursor.fetchall()]
 
     def get_module_types(self) -> List[str]:
         """Get list of all module types in the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT DISTINCT module_type FROM pv_modules WHERE module_type IS NOT NULL ORDER BY module_type")
             return [row[0] for row in cursor.fetchall()]
 
     def get_models_by_manufacturer(self, manufacturer: str) -> List[str]:
         """Get list of models for a specific manufacturer."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT DISTINCT model FROM pv_modules
@@ -540,145 +799,106 @@ class PVModuleDatabase:
             """, (manufacturer,))
             return [row[0] for row in cursor.fetchall()]
 
-    def get_statistics(self) -> Dict[str, Union[int, float]]:
-        """Get database statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Basic counts
-            cursor.execute("SELECT COUNT(*) FROM pv_modules")
-            total_modules = cursor.fetchone()[0]
+    def _refresh_stats(self, cursor) -> None:
+        """Rebuild the pv_modules_stats roll-up tables from pv_modules."""
+        cursor.execute(_SQL_STATS_AGGREGATE)
+        totals = cursor.fetchone()
+        cursor.execute("DELETE FROM pv_modules_stats")
+        cursor.executemany("INSERT INTO pv_modules_stats (k, v) VALUES (?, ?)", zip(STATS_KEYS, totals))
+        cursor.execute("DELETE FROM pv_modules_stats_cell_type")
+        cursor.execute(f"INSERT INTO pv_modules_stats_cell_type (cell_type, count) {_SQL_STATS_CELL_TYPES}")
 
-            cursor.execute("SELECT COUNT(DISTINCT manufacturer) FROM pv_modules")
-            total_manufacturers = cursor.fetchone()[0]
-
-            # Power statistics
-            cursor.execute("""
-                SELECT
-                    MIN(pmax_stc) as min_power,
-                    MAX(pmax_stc) as max_power,
-                    AVG(pmax_stc) as avg_power
-                FROM pv_modules
-                WHERE pmax_stc IS NOT NULL
-            """)
-            power_stats = cursor.fetchone()
-
-            # Efficiency statistics
-            cursor.execute("""
-                SELECT
-                    MIN(efficiency_stc) as min_efficiency,
-                    MAX(efficiency_stc) as max_efficiency,
-                    AVG(efficiency_stc) as avg_efficiency
-                FROM pv_modules
-                WHERE efficiency_stc IS NOT NULL
-            """)
-            efficiency_stats = cursor.fetchone()
+    def get_statistics(self) -> Dict[str, Union[int, float]]:
+        """
+        Get database statistics.
 
-            # Cell type distribution
-            cursor.execute("""
-                SELECT cell_type, COUNT(*) as count
-                FROM pv_modules
-                GROUP BY cell_type
-                ORDER BY count DESC
-            """)
+        Served from the pv_modules_stats roll-up that bulk ingests rebuild.
+        Other writes only clear it, and an empty roll-up is stale, so the
+        statistics are then aggregated from pv_modules directly.
+        """
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT k, v FROM pv_modules_stats")
+            totals = dict(cursor.fetchall())
+            if totals:
+                cursor.execute("SELECT cell_type, count FROM pv_modules_stats_cell_type ORDER BY count DESC")
+            else:
+                cursor.execute(_SQL_STATS_AGGREGATE)
+                totals = dict(zip(STATS_KEYS, cursor.fetchone()))
+                cursor.execute(f"{_SQL_STATS_CELL_TYPES} ORDER BY 2 DESC")
             cell_types = dict(cursor.fetchall())
 
-            # Models count (distinct models across manufacturers)
-            cursor.execute("SELECT COUNT(DISTINCT model) FROM pv_modules")
-            total_models = cursor.fetchone()[0]
+        # Build backward-compatible structure
+        min_power, max_power, avg_power, min_eff, max_eff, avg_eff = (
+            float(totals[key]) if totals.get(key) is not None else 0.0
+            for key in STATS_KEYS[3:]
+        )
 
-            # Build backward-compatible structure
-            min_power = float(power_stats[0]) if power_stats and power_stats[0] is not None else 0.0
-            max_power = float(power_stats[1]) if power_stats and power_stats[1] is not None else 0.0
-            avg_power = float(power_stats[2]) if power_stats and power_stats[2] is not None else 0.0
-            min_eff = float(efficiency_stats[0]) if efficiency_stats and efficiency_stats[0] is not None else 0.0
-            max_eff = float(efficiency_stats[1]) if efficiency_stats and efficiency_stats[1] is not None else 0.0
-            avg_eff = float(efficiency_stats[2]) if efficiency_stats and efficiency_stats[2] is not None else 0.0
-
-            return {
-                "total_modules": total_modules,
-                "total_manufacturers": total_manufacturers,
-                "total_models": total_models,
-                # flat stats
-                "min_power": min_power,
-                "max_power": max_power,
-                "avg_power": avg_power,
-                "min_efficiency": min_eff,
-                "max_efficiency": max_eff,
-                "avg_efficiency": avg_eff,
-                # nested ranges for CLI/UI compatibility
-                "power_range": {"min": min_power, "max": max_power, "avg": avg_power},
-                "efficiency_range": {"min": min_eff, "max": max_eff, "avg": avg_eff},
-                # distributions
-                "cell_type_distribution": cell_types,
-            }
+        return {
+            "total_modules": int(totals["total_modules"]),
+            "total_manufacturers": int(totals["total_manufacturers"]),
+            "total_models": int(totals["total_models"]),
+            # flat stats
+            "min_power": min_power,
+            "max_power": max_power,
+            "avg_power": avg_power,
+            "min_efficiency": min_eff,
+            "max_efficiency": max_eff,
+            "avg_efficiency": avg_eff,
+            # nested ranges for CLI/UI compatibility
+            "power_range": {"min": min_power, "max": max_power, "avg": avg_power},
+            "efficiency_range": {"min": min_eff, "max": max_eff, "avg": avg_eff},
+            # distributions
+            "cell_type_distribution": cell_types,
+        }
 
     def get_cell_type_statistics(self) -> List[Dict[str, Any]]:
         """Aggregate statistics grouped by cell type."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
                 SELECT
-                    cell_type,
+                    COALESCE(NULLIF(cell_type, ''), 'unknown') as cell_type,
                     COUNT(*) as count,
-                    AVG(pmax_stc) as avg_power,
-                    AVG(efficiency_stc) as avg_efficiency
+                    COALESCE(ROUND(AVG(pmax_stc), 1), 0) as avg_power,
+                    COALESCE(ROUND(AVG(efficiency_stc), 2), 0) as avg_efficiency
                 FROM pv_modules
                 WHERE cell_type IS NOT NULL
                 GROUP BY cell_type
                 ORDER BY count DESC
                 """
             )
-            rows = cursor.fetchall()
-            return [
-                {
-                    "cell_type": row[0] or "unknown",
-                    "count": row[1] or 0,
-                    "avg_power": round(row[2], 1) if row[2] else 0,
-                    "avg_efficiency": round(row[3], 2) if row[3] else 0,
-                }
-                for row in rows
-            ]
+            return [dict(row) for row in cursor]
 
     def get_module_type_statistics(self) -> List[Dict[str, Any]]:
         """Aggregate statistics grouped by module type."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
                 SELECT
-                    module_type,
+                    COALESCE(NULLIF(module_type, ''), 'unknown') as module_type,
                     COUNT(*) as count,
-                    AVG(pmax_stc) as avg_power,
-                    AVG(efficiency_stc) as avg_efficiency
+                    COALESCE(ROUND(AVG(pmax_stc), 1), 0) as avg_power,
+                    COALESCE(ROUND(AVG(efficiency_stc), 2), 0) as avg_efficiency
                 FROM pv_modules
                 WHERE module_type IS NOT NULL
                 GROUP BY module_type
                 ORDER BY count DESC
                 """
             )
-            rows = cursor.fetchall()
-            return [
-                {
-                    "module_type": row[0] or "unknown",
-                    "count": row[1] or 0,
-                    "avg_power": round(row[2], 1) if row[2] else 0,
-                    "avg_efficiency": round(row[3], 2) if row[3] else 0,
-                }
-                for row in rows
-            ]
+            return [dict(row) for row in cursor]
 
     def get_power_range_distribution(self, bin_size: Optional[float] = None) -> List[Dict[str, Any]]:
         """Return distribution of modules across power ranges."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT MIN(pmax_stc), MAX(pmax_stc) FROM pv_modules WHERE pmax_stc IS NOT NULL")
-            row = cursor.fetchone()
-            if not row or row[0] is None or row[1] is None:
-                return []
+        ranges = self.get_dashboard_ranges()
+        if ranges["power_min"] is None or ranges["power_max"] is None:
+            return []
 
-            min_power, max_power = float(row[0]), float(row[1])
+        with self._read() as conn:
+            cursor = conn.cursor()
+            min_power, max_power = float(ranges["power_min"]), float(ranges["power_max"])
             span = max_power - min_power
             if span <= 0:
                 return []
@@ -711,14 +931,13 @@ class PVModuleDatabase:
 
     def get_efficiency_range_distribution(self, bin_size: Optional[float] = None) -> List[Dict[str, Any]]:
         """Return distribution of modules across efficiency ranges."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT MIN(efficiency_stc), MAX(efficiency_stc) FROM pv_modules WHERE efficiency_stc IS NOT NULL")
-            row = cursor.fetchone()
-            if not row or row[0] is None or row[1] is None:
-                return []
+        ranges = self.get_dashboard_ranges()
+        if ranges["efficiency_min"] is None or ranges["efficiency_max"] is None:
+            return []
 
-            min_eff, max_eff = float(row[0]), float(row[1])
+        with self._read() as conn:
+            cursor = conn.cursor()
+            min_eff, max_eff = float(ranges["efficiency_min"]), float(ranges["efficiency_max"])
             span = max_eff - min_eff
             if span <= 0:
                 return []
@@ -732,83 +951,112 @@ class PVModuleDatabase:
                 else:
                     bin_size = 1.0
 
-            # Build bins
-            import math
-            start = math.floor(min_eff / bin_size) * bin_size
-            end = math.ceil(max_eff / bin_size) * bin_size
-            bins = []
-            current = start
-            while current < end:
-                bins.append({"min_efficiency": current, "max_efficiency": current + bin_size, "count": 0})
-                current += bin_size
+            # Work in whole bin indices: floor/ceil via integer division, no float accumulation
+            start_idx = int(min_eff // bin_size)
+            end_idx = int(-(-max_eff // bin_size))
+            counts = [0] * (end_idx - start_idx)
 
-            # Fetch all efficiencies and bin
-            cursor.execute("SELECT efficiency_stc FROM pv_modules WHERE efficiency_stc IS NOT NULL")
-            effs = [float(r[0]) for r in cursor.fetchall()]
-            for e in effs:
-                idx = int((e - start) // bin_size)
-                if 0 <= idx < len(bins):
-                    bins[idx]["count"] += 1
+            # SQLite truncates each value to its bin index (efficiencies are positive)
+            # and counts per bin; the default bin sizes reuse a fixed statement text
+            if bin_size in EFFICIENCY_BIN_QUERIES:
+                cursor.execute(EFFICIENCY_BIN_QUERIES[bin_size])
+            else:
+                cursor.execute(
+                    """
+                    SELECT CAST(efficiency_stc / ? AS INTEGER), COUNT(*)
+                    FROM pv_modules
+                    WHERE efficiency_stc IS NOT NULL
+                    GROUP BY 1
+                    """,
+                    (bin_size,),
+                )
+            nbins = len(counts)
+            for bin_idx, count in cursor:
+                idx = bin_idx - start_idx
+                if 0 <= idx < nbins:
+                    counts[idx] += count
 
-            return bins
+            return [
+                {
+                    "min_efficiency": (start_idx + i) * bin_size,
+                    "max_efficiency": (start_idx + i + 1) * bin_size,
+                    "count": count,
+                }
+                for i, count in enumerate(counts)
+            ]
+
+    def get_manufacturer_statistics(self, limit: Optional[int] = None,
+                                    format_power_range: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get statistics grouped by manufacturer.
+
+        Args:
+            limit: Maximum number of manufacturers to return
+            format_power_range: Whether to build the "min-maxW" label for each row.
+                Callers that only need the numeric values can skip it.
 
-    def get_manufacturer_statistics(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get statistics grouped by manufacturer."""
-        with sqlite3.connect(self.db_path) as conn:
+        Returns:
+            List of per-manufacturer statistics, largest first
+        """
+        with self._read() as conn:
             cursor = conn.cursor()
 
+            # Rounding and NULL handling are done by SQLite; column aliases are the result keys
             query = """
                 SELECT
                     manufacturer,
                     COUNT(*) as module_count,
-                    AVG(pmax_stc) as avg_power,
-                    AVG(efficiency_stc) as avg_efficiency,
-                    MIN(pmax_stc) as min_power,
-                    MAX(pmax_stc) as max_power
+                    COALESCE(ROUND(AVG(pmax_stc), 1), 0) as avg_power,
+                    COALESCE(ROUND(AVG(efficiency_stc), 2), 0) as avg_efficiency,
+                    COALESCE(MIN(pmax_stc), 0) as min_power,
+                    COALESCE(MAX(pmax_stc), 0) as max_power
                 FROM pv_modules
                 WHERE pmax_stc IS NOT NULL
                 GROUP BY manufacturer
                 ORDER BY module_count DESC
             """
+            params: List[Any] = []
 
             if limit:
-                query += f" LIMIT {limit}"
+                query += " LIMIT ?"
+                params.append(limit)
 
-            cursor.execute(query)
-            results = cursor.fetchall()
+            cursor.execute(query, params)
 
-            return [
-                {
-                    "manufacturer": row[0],
-                    "module_count": row[1],
-                    "avg_power": round(row[2], 1) if row[2] else 0,
-                    "avg_efficiency": round(row[3], 2) if row[3] else 0,
-                    "min_power": row[4] if row[4] else 0,
-                    "max_power": row[5] if row[5] else 0,
-                    "power_range": f"{row[4]:.0f}-{row[5]:.0f}W" if row[4] and row[5] else "N/A"
-                }
-                for row in results
-            ]
+            stats = [dict(row) for row in cursor]
+            if format_power_range:
+                for entry in stats:
+                    min_power, max_power = entry["min_power"], entry["max_power"]
+                    entry["power_range"] = (
+                        f"{min_power:.0f}-{max_power:.0f}W" if min_power and max_power else "N/A"
+                    )
+
+            return stats
 
     # --- New helpers for raw values (for box plots and advanced charts) ---
     def get_all_powers(self) -> List[float]:
         """Return a list of all module Pmax (W) values available."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT pmax_stc FROM pv_modules WHERE pmax_stc IS NOT NULL")
-            return [float(r[0]) for r in cursor.fetchall() if r[0] is not None]
+            # REAL column filtered by the WHERE clause: values are already non-null floats
+            return [r[0] for r in cursor]
 
     def get_all_efficiencies(self) -> List[float]:
         """Return a list of all module efficiency (%) values available."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT efficiency_stc FROM pv_modules WHERE efficiency_stc IS NOT NULL")
-            return [float(r[0]) for r in cursor.fetchall() if r[0] is not None]
+            # REAL column filtered by the WHERE clause: values are already non-null floats
+            return [r[0] for r in cursor]
 
     def export_to_csv(self, output_file: str, filters: Optional[Dict] = None) -> int:
         """
         Export modules to CSV file.
 
+        Rows are streamed straight from the cursor to disk, so memory use
+        does not grow with the size of the export.
+
         Args:
             output_file: Path to output CSV file
             filters: Optional filters to apply (same as search_modules)
@@ -818,25 +1066,23 @@ class PVModuleDatabase:
         """
         import csv
 
-        # Get modules with filters
-        if filters:
-            modules = self.search_modules(**filters)
-        else:
-            modules = self.search_modules()
-
-        if not modules:
+        rows = self._search_iter(**(filters or {}))
+        first = next(rows, None)
+        if first is None:
             return 0
 
         # Write to CSV
         with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = modules[0].keys()
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.writer(csvfile)
+            writer.writerow(first.keys())
+            writer.writerow(first)
 
-            writer.writeheader()
-            for module in modules:
-                writer.writerow(module)
+            count = 1
+            for row in rows:
+                writer.writerow(row)
+                count += 1
 
-        return len(modules)
+        return count
 
     def compare_modules(self, module_ids: List[int]) -> List[Dict]:
         """
@@ -846,71 +1092,199 @@ class PVModuleDatabase:
             module_ids: List of module IDs to compare
 
         Returns:
-            List of module data for comparison
+            List of module data for comparison, in the order requested
         """
-        modules = []
-        for module_id in module_ids:
-            module = self.get_module_by_id(module_id)
-            if module:
-                modules.append(module)
+        unique_ids = list(dict.fromkeys(module_ids))
+        by_id: Dict[int, Dict] = {}
 
-        return modules
+        with self._read() as conn:
+            cursor = conn.cursor()
+            # Stay under SQLite's host-parameter limit for very long id lists
+            for i in range(0, len(unique_ids), MAX_SQL_VARIABLES):
+                chunk = unique_ids[i:i + MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"SELECT {_MODULE_COLS} FROM pv_modules WHERE id IN ({placeholders})", chunk)
+                for row in cursor:
+                    by_id[row["id"]] = dict(row)
+
+        return [by_id[module_id] for module_id in module_ids if module_id in by_id]
+
+    def get_dashboard_ranges(self) -> Dict[str, Optional[float]]:
+        """
+        Get min/max power, efficiency, height and width in a single table scan.
+
+        Height and width ranges only consider modules that have both
+        dimensions. The result is cached until another connection commits a
+        change. Missing values are returned as None.
+        """
+        with self._read() as conn:
+            # data_version changes on this connection whenever another one commits
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+            cached = self._ranges_cache
+            if cached is not None and cached[0] is conn and cached[1] == version:
+                return dict(cached[2])
 
-    def get_size_range(self) -> Dict[str, float]:
-        """Get min/max ranges for height and width in mm."""
-        with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
-                SELECT MIN(height), MAX(height), MIN(width), MAX(width)
+                SELECT
+                    MIN(pmax_stc) AS power_min,
+                    MAX(pmax_stc) AS power_max,
+                    MIN(efficiency_stc) AS efficiency_min,
+                    MAX(efficiency_stc) AS efficiency_max,
+                    MIN(CASE WHEN width IS NOT NULL THEN height END) AS height_min,
+                    MAX(CASE WHEN width IS NOT NULL THEN height END) AS height_max,
+                    MIN(CASE WHEN height IS NOT NULL THEN width END) AS width_min,
+                    MAX(CASE WHEN height IS NOT NULL THEN width END) AS width_max
                 FROM pv_modules
-                WHERE height IS NOT NULL AND width IS NOT NULL
                 """
             )
-            row = cursor.fetchone()
-            if not row:
-                return {"height_min": 0, "height_max": 0, "width_min": 0, "width_max": 0}
-            return {
-                "height_min": float(row[0]) if row[0] is not None else 0,
-                "height_max": float(row[1]) if row[1] is not None else 0,
-                "width_min": float(row[2]) if row[2] is not None else 0,
-                "width_max": float(row[3]) if row[3] is not None else 0,
-            }
+            ranges = dict(cursor.fetchone())
+            self._ranges_cache = (conn, version, ranges)
+            return dict(ranges)
 
-    def bulk_insert_from_parser_results(self, results: Dict[str, ParsingResult], update_existing: bool = True) -> Dict[str, int]:
+    def get_size_range(self) -> Dict[str, float]:
+        """Get min/max ranges for height and width in mm."""
+        ranges = self.get_dashboard_ranges()
+        return {
+            key: float(ranges[key]) if ranges[key] is not None else 0
+            for key in ("height_min", "height_max", "width_min", "width_max")
+        }
+
+    def _existing_unique_ids(self, unique_ids: List[str]) -> set:
+        """Return the subset of unique_ids already stored, in one query per chunk."""
+        existing: set = set()
+        with self._read() as conn:
+            cursor = conn.cursor()
+            for i in range(0, len(unique_ids), MAX_SQL_VARIABLES):
+                chunk = unique_ids[i:i + MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"SELECT unique_id FROM pv_modules WHERE unique_id IN ({placeholders})", chunk)
+                existing.update(row[0] for row in cursor)
+        return existing
+
+    def bulk_insert_from_parser_results(
+        self,
+        results: Union[Dict[str, ParsingResult], Iterable[Tuple[str, ParsingResult]]],
+        update_existing: bool = True,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> Dict[str, int]:
         """
         Bulk insert modules from parser results.
 
+        A dictionary is written in one transaction. Any other iterable of
+        (file_path, result) pairs is consumed on the calling thread while a
+        writer thread commits it in batches of ``batch_size``, so parsing can
+        continue while earlier batches are written.
+
         Args:
-            results: Dictionary of parsing results from parser
+            results: Dictionary of parsing results from parser, or an iterable
+                of (file_path, result) pairs such as a lazy parsing generator
             update_existing: Whether to update existing modules or skip them
+            batch_size: Results per transaction when streaming an iterable
 
         Returns:
             Dictionary with statistics of insertion
         """
-        inserted = 0
+        if isinstance(results, dict):
+            stats = self._insert_result_batch(list(results.items()), update_existing)
+            self._finish_bulk_ingest()
+            return stats
+
+        batches: "queue.Queue[Optional[List[Tuple[str, ParsingResult]]]]" = queue.Queue(maxsize=2)
+        stats = {"inserted": 0, "updated": 0, "skipped": 0, "failed": 0, "total": 0}
+        errors: List[Exception] = []
+
+        def write_batches() -> None:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    return
+                if errors:
+                    continue
+                try:
+                    for key, value in self._insert_result_batch(batch, update_existing).items():
+                        stats[key] += value
+                except Exception as e:
+                    errors.append(e)
+
+        writer = threading.Thread(target=write_batches, name="pv-db-writer", daemon=True)
+        writer.start()
+        try:
+            batch: List[Tuple[str, ParsingResult]] = []
+            for item in results:
+                if errors:
+                    break  # The writer failed; stop pulling (and parsing) more input
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    batches.put(batch)
+                    batch = []
+            if batch and not errors:
+                batches.put(batch)
+        finally:
+            batches.put(None)
+            writer.join()
+
+        if errors:
+            raise errors[0]
+        self._finish_bulk_ingest()
+        return stats
+
+    def _insert_result_batch(self, results: List[Tuple[str, ParsingResult]], update_existing: bool) -> Dict[str, int]:
+        """Write one batch of (file_path, result) pairs in a single transaction."""
         updated = 0
         skipped = 0
         failed = 0
 
-        for file_path, result in results.items():
+        new_modules: List[Tuple[str, PVModule]] = []
+        queued: set = set()
+        pending_updates: List[Tuple[str, PVModule]] = []
+
+        existing = self._existing_unique_ids(
+            [result.module.unique_id for _, result in results if result.success and result.module]
+        )
+
+        for file_path, result in results:
             if result.success and result.module:
                 try:
-                    if self.module_exists(result.module.unique_id):
+                    unique_id = result.module.unique_id
+                    # A module repeated within this batch is an update of the first copy
+                    if unique_id in queued or unique_id in existing:
                         if update_existing:
-                            self.insert_module(result.module, update_if_exists=True)
-                            updated += 1
+                            pending_updates.append((file_path, result.module))
                         else:
                             skipped += 1
                     else:
-                        self.insert_module(result.module, update_if_exists=False)
-                        inserted += 1
+                        queued.add(unique_id)
+                        new_modules.append((file_path, result.module))
                 except Exception as e:
                     print(f"Failed to insert module from {file_path}: {e}")
                     failed += 1
             else:
                 failed += 1
 
+        try:
+            inserted, updated = self._bulk_write_modules(new_modules, pending_updates)
+        except Exception as e:
+            # The transaction was rolled back; retry one module at a time so a
+            # bad record only fails itself
+            print(f"Batch insert failed ({e}), inserting modules one by one")
+            inserted = 0
+            for file_path, module in new_modules:
+                try:
+                    self.insert_module(module, update_if_exists=False)
+                    inserted += 1
+                except Exception as e:
+                    print(f"Failed to insert module from {file_path}: {e}")
+                    failed += 1
+            for file_path, module in pending_updates:
+                try:
+                    self.update_module(module)
+                    updated += 1
+                except Exception as e:
+                    print(f"Failed to insert module from {file_path}: {e}")
+                    failed += 1
+
         return {
             "inserted": inserted,
             "updated": updated,
@@ -921,52 +1295,72 @@ class PVModuleDatabase:
 
     def clear_database(self) -> None:
         """Clear all data from the database (for testing purposes)."""
-        import gc
-        import time
+        with self._write() as conn:
+            cursor = conn.cursor()
+            # Dropping frees each table's pages at once, where DELETE would visit
+            # and journal every row; it also drops their AUTOINCREMENT counters
+            # and planner statistics. Children first so no row ever references
+            # a deleted module
+            for table in ("raw_pan_data", "certifications", "pv_modules_stats_cell_type",
+                          "pv_modules_stats", "pv_modules"):
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        self.init_database()
 
-        # Force garbage collection to close any lingering connections
-        gc.collect()
-        time.sleep(0.1)  # Small delay
+    # --- Maintenance and utility operations expected by CLI/Desktop ---
+    def backup(self, dest: Union[str, Path]) -> None:
+        """
+        Write a consistent copy of the database to dest.
 
-        try:
-            if self.db_path.exists():
-                # Remove the entire database file to force schema recreation
-                self.db_path.unlink()
-                print("Database file deleted successfully")
-            else:
-                print("No database file found")
-        except PermissionError:
-            # Fallback: just clear the data if file is locked
-            print("Database file locked, clearing data instead")
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DROP TABLE IF EXISTS raw_pan_data")
-                cursor.execute("DROP TABLE IF EXISTS certifications")
-                cursor.execute("DROP TABLE IF EXISTS pv_modules")
-                conn.commit()
-                print("Database tables dropped successfully")
+        Uses SQLite's online backup, so the copy includes commits that are
+        still in the -wal file; copying the main file alone would miss them.
+        """
+        with self._read() as conn:
+            target = sqlite3.connect(dest)
+            try:
+                conn.backup(target)
+            finally:
+                target.close()
+
+    def restore(self, source: Union[str, Path]) -> None:
+        """
+        Replace the database contents with the database at source.
 
-        # Reinitialize with new schema
+        Uses SQLite's online backup into the live database, so the -wal file
+        is rewritten with it; copying over the main file would leave a stale
+        -wal for SQLite to replay onto the restored data. Backups taken by
+        older versions are brought up to the current schema.
+        """
+        source_conn = sqlite3.connect(source)
+        try:
+            with self._write() as conn:
+                source_conn.backup(conn)
+        finally:
+            source_conn.close()
+        self._ranges_cache = None
         self.init_database()
 
-    # --- Maintenance and utility operations expected by CLI/Desktop ---
+    def file_size(self) -> int:
+        """Bytes on disk for the database, including its -wal file."""
+        wal = self.db_path.with_name(self.db_path.name + "-wal")
+        return sum(path.stat().st_size for path in (self.db_path, wal) if path.exists())
+
     def vacuum_database(self) -> None:
         """Run VACUUM to rebuild the database file and reclaim space."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write() as conn:
             cursor = conn.cursor()
             cursor.execute("VACUUM")
             conn.commit()
 
     def analyze_database(self) -> None:
         """Run ANALYZE to update SQLite statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write() as conn:
             cursor = conn.cursor()
             cursor.execute("ANALYZE")
             conn.commit()
 
     def rebuild_indexes(self) -> None:
         """Rebuild indexes (REINDEX)."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write() as conn:
             cursor = conn.cursor()
             cursor.execute("REINDEX")
             conn.commit()
@@ -974,7 +1368,7 @@ class PVModuleDatabase:
     def check_integrity(self) -> Dict[str, Any]:
         """Run PRAGMA integrity_check and return results."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 cursor.execute("PRAGMA integrity_check")
                 rows = cursor.fetchall()
@@ -986,44 +1380,62 @@ class PVModuleDatabase:
     def get_table_info(self) -> List[Dict[str, Any]]:
         """Return basic table info: name and row counts.
 
+        ``pv_modules`` is always counted exactly. Other tables take their count
+        from ``sqlite_stat1`` when ANALYZE has been run, flagged with
+        ``estimated`` since it may lag behind writes made since; tables without
+        statistics are counted directly.
+
         Note: SQLite doesn't provide per-table size easily; size_bytes will be 0.
         """
         info: List[Dict[str, Any]] = []
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
+
+            # Every sqlite_stat1 row starts with the row count of its table
+            try:
+                cursor.execute("SELECT tbl, stat FROM sqlite_stat1")
+                estimates = {tbl: int(stat.split()[0]) for tbl, stat in cursor.fetchall() if stat}
+            except sqlite3.OperationalError:
+                estimates = {}
+
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
             tables = [r[0] for r in cursor.fetchall()]
             for t in tables:
-                try:
-                    cursor.execute(f"SELECT COUNT(*) FROM {t}")
-                    count = int(cursor.fetchone()[0])
-                except Exception:
-                    count = 0
-                info.append({"name": t, "row_count": count, "size_bytes": 0})
+                # Statistics are only refreshed by bulk ingests, after large
+                # changes, so single inserts would never show in an estimate
+                count = estimates.get(t) if t != "pv_modules" else None
+                estimated = bool(count)
+                if not estimated:
+                    try:
+                        cursor.execute(f"SELECT COUNT(*) FROM {t}")
+                        count = int(cursor.fetchone()[0])
+                    except Exception:
+                        count = 0
+                info.append({"name": t, "row_count": count, "estimated": estimated, "size_bytes": 0})
         return info
 
     def get_raw_pan_data(self, module_id: int) -> Dict[str, Any]:
         """Return raw .PAN key/value data for a given module id."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        with self._read() as conn:
+            row = conn.execute("SELECT raw_pan_json FROM pv_modules WHERE id = ?", (module_id,)).fetchone()
+            if row is not None and row[0] is not None:
+                return json.loads(row[0])
+            # Modules stored before raw_pan_json existed keep one row per parameter
+            return dict(conn.execute(
                 "SELECT parameter_name, parameter_value FROM raw_pan_data WHERE module_id = ?",
                 (module_id,),
-            )
-            rows = cursor.fetchall()
-            return {name: value for name, value in rows}
+            ))
 
     def find_orphaned_records(self) -> List[Dict[str, Any]]:
         """Find records in auxiliary tables that reference non-existent modules."""
         issues: List[Dict[str, Any]] = []
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             # Certifications orphans
             cursor.execute(
                 """
                 SELECT c.id, c.module_id FROM certifications c
-                LEFT JOIN pv_modules m ON m.id = c.module_id
-                WHERE m.id IS NULL
+                WHERE NOT EXISTS (SELECT 1 FROM pv_modules m WHERE m.id = c.module_id)
                 """
             )
             for cid, mid in cursor.fetchall():
@@ -1033,8 +1445,7 @@ class PVModuleDatabase:
             cursor.execute(
                 """
                 SELECT r.id, r.module_id FROM raw_pan_data r
-                LEFT JOIN pv_modules m ON m.id = r.module_id
-                WHERE m.id IS NULL
+                WHERE NOT EXISTS (SELECT 1 FROM pv_modules m WHERE m.id = r.module_id)
                 """
             )
             for rid, mid in cursor.fetchall():
@@ -1043,48 +1454,46 @@ class PVModuleDatabase:
 
     def get_technology_statistics(self) -> Dict[str, Any]:
         """Return simple technology statistics for CLI/UI usage."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
 
-            # Most common cell type
+            # Most common cell/module type and averages in a single statement
             cursor.execute(
                 """
-                SELECT cell_type, COUNT(*) as cnt
-                FROM pv_modules
-                WHERE cell_type IS NOT NULL
-                GROUP BY cell_type
-                ORDER BY cnt DESC
-                LIMIT 1
-                """
-            )
-            row = cursor.fetchone()
-            most_common_cell_type = row[0] if row else None
-
-            # Most common module type
-            cursor.execute(
-                """
-                SELECT module_type, COUNT(*) as cnt
-                FROM pv_modules
-                WHERE module_type IS NOT NULL
-                GROUP BY module_type
-                ORDER BY cnt DESC
-                LIMIT 1
+                WITH ct AS (
+                    SELECT cell_type, COUNT(*) AS cnt
+                    FROM pv_modules
+                    WHERE cell_type IS NOT NULL
+                    GROUP BY cell_type
+                    ORDER BY cnt DESC
+                    LIMIT 1
+                ),
+                mt AS (
+                    SELECT module_type, COUNT(*) AS cnt
+                    FROM pv_modules
+                    WHERE module_type IS NOT NULL
+                    GROUP BY module_type
+                    ORDER BY cnt DESC
+                    LIMIT 1
+                ),
+                av AS (
+                    SELECT AVG(area_m2) AS avg_area, AVG(power_density) AS avg_power_density
+                    FROM pv_modules
+                    WHERE area_m2 IS NOT NULL
+                )
+                SELECT
+                    (SELECT cell_type FROM ct),
+                    (SELECT module_type FROM mt),
+                    av.avg_area,
+                    av.avg_power_density
+                FROM av
                 """
             )
-            row = cursor.fetchone()
-            most_common_module_type = row[0] if row else None
-
-            # Averages
-            cursor.execute(
-                "SELECT AVG(area_m2), AVG(power_density) FROM pv_modules WHERE area_m2 IS NOT NULL"
-            )
-            row = cursor.fetchone()
-            avg_area = float(row[0]) if row and row[0] is not None else 0.0
-            avg_power_density = float(row[1]) if row and row[1] is not None else 0.0
+            most_common_cell_type, most_common_module_type, avg_area, avg_power_density = cursor.fetchone()
 
             return {
                 "most_common_cell_type": most_common_cell_type or "unknown",
                 "most_common_module_type": most_common_module_type or "unknown",
-                "avg_area": avg_area,
-                "avg_power_density": avg_power_density,
-            }
\ No newline at end of file
+                "avg_area": float(avg_area) if avg_area is not None else 0.0,
+                "avg_power_density": float(avg_power_density) if avg_power_density is not None else 0.0,
+            }
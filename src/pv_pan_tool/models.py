@@ -1,41 +1,139 @@
 """Data models for PV module specifications using Pydantic."""
 
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from enum import Enum
+from functools import cache, cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    model_validator,
+    validator,
+)
+
+# Build each model's validator and serializer on first use rather than at
+# import, so importing the package for one model doesn't pay for all of them.
+# No json_encoders: pydantic-core already writes datetimes as ISO 8601 and
+# paths as strings without calling back into Python.
+_MODEL_CONFIG = ConfigDict(defer_build=True)
+
+# Fields sharing a validator, and its error messages
+_POSITIVE_ELECTRICAL_FIELDS = ('pmax_stc', 'vmp_stc', 'imp_stc', 'voc_stc', 'isc_stc',
+                               'r_series', 'r_shunt', 'max_system_voltage')
+
+# Incidence angles (degrees) of the IAM profile, in ElectricalParameters.iam_values order
+IAM_ANGLES = (0, 30, 45, 60, 70, 75, 80, 85, 90)
+_IAM_FIELDS = tuple(f'iam_{angle}' for angle in IAM_ANGLES)
+_POSITIVE_PHYSICAL_FIELDS = ('width', 'height', 'thickness', 'weight', 'cell_area', 'area')
+
+_POSITIVE_MESSAGE = 'Value must be positive'
+_BIFACIAL_RANGE_MESSAGE = 'Bifaciality factor must be between 0 and 1'
+_IAM_RANGE_MESSAGE = 'IAM values must be between 0 and 1'
+_PHYSICAL_POSITIVE_MESSAGE = 'Physical parameters must be positive'
+
+
+# Solar cell technologies
+CellType = Literal[
+    "monocrystalline",
+    "polycrystalline",
+    "thin_film",
+    "cis",  # Copper indium selenide
+    "cigs",  # Copper indium gallium selenide
+    "cdte",  # Cadmium telluride
+    "perc",
+    "bifacial",
+    "hjt",  # Heterojunction
+    "ibc",  # Interdigitated back contact
+    "unknown",
+]
+CELL_TYPES: FrozenSet[str] = frozenset(get_args(CellType))
+
+# Module construction types
+ModuleType = Literal[
+    "standard",
+    "bifacial",
+    "glass_glass",
+    "flexible",
+    "bipv",  # Building integrated
+    "unknown",
+]
+MODULE_TYPES: FrozenSet[str] = frozenset(get_args(ModuleType))
+
+
+# Timestamp shared by every file parsed inside one parsing_session()
+_PARSED_AT: ContextVar[Optional[datetime]] = ContextVar('parsed_at', default=None)
+
+
+def parsed_at_now() -> datetime:
+    """Current parsing_session() timestamp, or now outside of a session."""
+    return _PARSED_AT.get() or datetime.now()
+
+
+@contextmanager
+def parsing_session(parsed_at: Optional[datetime] = None) -> Iterator[datetime]:
+    """Pin one parsed_at timestamp (default: now) for every file parsed in this block."""
+    token = _PARSED_AT.set(parsed_at or datetime.now())
+    try:
+        yield _PARSED_AT.get()
+    finally:
+        _PARSED_AT.reset(token)
+
+
+def _intern(value):
+    """Share one string object per distinct value across all modules.
+
+    Manufacturer names, countries and folder names repeat across hundreds of
+    files, so a large corpus would otherwise hold many equal copies.
+    """
+    return sys.intern(value) if type(value) is str else value
+
 
-from pydantic import BaseModel, Field, model_validator, validator
+def _iam_property(index: int) -> property:
+    """Read-only accessor for one angle of ElectricalParameters.iam_values."""
+    def getter(self) -> Optional[float]:
+        return self.iam_values[index] if self.iam_values else None
+    return property(getter, doc=f"IAM at {IAM_ANGLES[index]}° incidence")
 
 
-class CellType(str, Enum):
-    """Enumeration of solar cell types."""
-    MONOCRYSTALLINE = "monocrystalline"
-    POLYCRYSTALLINE = "polycrystalline"
-    THIN_FILM = "thin_film"
-    CIS = "cis"  # Copper indium selenide
-    CIGS = "cigs"  # Copper indium gallium selenide
-    CDTE = "cdte"  # Cadmium telluride
-    PERC = "perc"
-    BIFACIAL = "bifacial"
-    HJT = "hjt"  # Heterojunction
-    IBC = "ibc"  # Interdigitated back contact
-    UNKNOWN = "unknown"
+def _derive_physical(width: Optional[float], height: Optional[float],
+                     cells_in_series: Optional[int], cells_in_parallel: Optional[int]):
+    """Return (area in m², total cells), each None when its inputs are missing."""
+    area = width * height / 1_000_000 if width is not None and height is not None else None  # mm² to m²
+    if cells_in_series is not None and cells_in_parallel is not None:
+        total_cells = cells_in_series * cells_in_parallel
+    else:
+        total_cells = None
+    return area, total_cells
 
 
-class ModuleType(str, Enum):
-    """Enumeration of module types."""
-    STANDARD = "standard"
-    BIFACIAL = "bifacial"
-    GLASS_GLASS = "glass_glass"
-    FLEXIBLE = "flexible"
-    BUILDING_INTEGRATED = "bipv"
-    UNKNOWN = "unknown"
+def _efficiency(pmax: float, area: float) -> float:
+    """Efficiency in % from power (W) and area (m²) at 1000 W/m²."""
+    return (pmax / (area * 1000)) * 100
 
 
 class ElectricalParameters(BaseModel):
     """Electrical parameters of a PV module."""
 
+    model_config = _MODEL_CONFIG
+
     # Standard test conditions (STC)
     pmax_stc: Optional[float] = Field(None, description="Maximum power at STC (W)")
     vmp_stc: Optional[float] = Field(None, description="Voltage at maximum power at STC (V)")
@@ -65,36 +163,50 @@ class ElectricalParameters(BaseModel):
     bifaciality_factor: Optional[float] = Field(None, description="Bifaciality factor (0-1)")
 
     # Incidence Angle Modifier (IAM) profile
-    iam_0: Optional[float] = Field(None, description="IAM at 0° incidence")
-    iam_30: Optional[float] = Field(None, description="IAM at 30° incidence")
-    iam_45: Optional[float] = Field(None, description="IAM at 45° incidence")
-    iam_60: Optional[float] = Field(None, description="IAM at 60° incidence")
-    iam_70: Optional[float] = Field(None, description="IAM at 70° incidence")
-    iam_75: Optional[float] = Field(None, description="IAM at 75° incidence")
-    iam_80: Optional[float] = Field(None, description="IAM at 80° incidence")
-    iam_85: Optional[float] = Field(None, description="IAM at 85° incidence")
-    iam_90: Optional[float] = Field(None, description="IAM at 90° incidence")
+    iam_values: Optional[Tuple[Optional[float], ...]] = Field(
+        None, min_length=len(IAM_ANGLES), max_length=len(IAM_ANGLES),
+        description="IAM at each angle of IAM_ANGLES (None where not given)"
+    )
+
+    iam_0 = _iam_property(0)
+    iam_30 = _iam_property(1)
+    iam_45 = _iam_property(2)
+    iam_60 = _iam_property(3)
+    iam_70 = _iam_property(4)
+    iam_75 = _iam_property(5)
+    iam_80 = _iam_property(6)
+    iam_85 = _iam_property(7)
+    iam_90 = _iam_property(8)
 
     # Validators
-    @validator('pmax_stc', 'vmp_stc', 'imp_stc', 'voc_stc', 'isc_stc',
-               'r_series', 'r_shunt', 'max_system_voltage')
+    @validator(*_POSITIVE_ELECTRICAL_FIELDS)
     def validate_positive(cls, v):
         if v is not None and v <= 0:
-            raise ValueError('Value must be positive')
+            raise ValueError(_POSITIVE_MESSAGE)
         return v
 
     @validator('bifaciality_factor')
     def validate_bifacial_range(cls, v):
-        if v is not None and (v < 0 or v > 1):
-            raise ValueError('Bifaciality factor must be between 0 and 1')
+        if v is not None and not 0 <= v <= 1:
+            raise ValueError(_BIFACIAL_RANGE_MESSAGE)
         return v
 
-    @validator('iam_0', 'iam_30', 'iam_45', 'iam_60', 'iam_70', 'iam_75', 'iam_80', 'iam_85', 'iam_90')
+    @validator('iam_values')
     def validate_iam_range(cls, v):
-        if v is not None and (v < 0 or v > 1):
-            raise ValueError('IAM values must be between 0 and 1')
+        if v is not None and any(value is not None and not 0 <= value <= 1 for value in v):
+            raise ValueError(_IAM_RANGE_MESSAGE)
         return v
 
+    @model_validator(mode='before')
+    @classmethod
+    def collect_iam_fields(cls, data):
+        """Accept the per-angle iam_<angle> keywords and pack them into iam_values."""
+        if isinstance(data, dict) and any(name in data for name in _IAM_FIELDS):
+            data = dict(data)
+            values = tuple(data.pop(name, None) for name in _IAM_FIELDS)
+            data.setdefault('iam_values', values)
+        return data
+
 
 class PhysicalParameters(BaseModel):
     """Physical parameters of a PV module.
@@ -103,6 +215,8 @@ class PhysicalParameters(BaseModel):
            while 'width' is the horizontal dimension.
     """
 
+    model_config = _MODEL_CONFIG
+
     # Renamed fields to match parser output
     width: Optional[float] = Field(None, description="Module width (mm)")
     height: Optional[float] = Field(None, description="Module height (mm)")
@@ -116,41 +230,101 @@ class PhysicalParameters(BaseModel):
     cell_area: Optional[float] = Field(None, description="Area of a single cell (cm²)")
 
     # Validators
-    @validator('width', 'height', 'thickness', 'weight', 'cell_area', 'area')
+    @validator(*_POSITIVE_PHYSICAL_FIELDS)
     def validate_positive(cls, v):
         if v is not None and v <= 0:
-            raise ValueError('Physical parameters must be positive')
+            raise ValueError(_PHYSICAL_POSITIVE_MESSAGE)
         return v
 
     @model_validator(mode='after')
     def calculate_derived_fields(self):
-        # Calculate total cells if possible
-        if self.cells_in_series is not None and self.cells_in_parallel is not None:
-            self.total_cells = self.cells_in_series * self.cells_in_parallel
-
-        # Calculate area if possible
-        if self.width is not None and self.height is not None:
-            # Convert mm to m²
-            self.area = (self.width / 1000) * (self.height / 1000)
+        # Nothing left to derive when both were given
+        if self.area is not None and self.total_cells is not None:
+            return self
+
+        area, total_cells = _derive_physical(self.width, self.height,
+                                             self.cells_in_series, self.cells_in_parallel)
+        # Plain attribute writes; these values need no re-validation
+        if total_cells is not None:
+            object.__setattr__(self, 'total_cells', total_cells)
+        if area is not None:
+            object.__setattr__(self, 'area', area)
 
         return self
 
 
+class CertBit:
+    """Bit positions of the standard certifications in CertificationInfo masks."""
+    IEC_61215 = 1
+    IEC_61730 = 2
+    UL_LISTED = 4
+    CE_MARKING = 8
+    SANDIA = 16
+
+
+_CERT_BITS = {
+    'iec_61215': CertBit.IEC_61215,
+    'iec_61730': CertBit.IEC_61730,
+    'ul_listed': CertBit.UL_LISTED,
+    'ce_marking': CertBit.CE_MARKING,
+    'sandia_certified': CertBit.SANDIA,
+}
+
+
+def _cert_property(bit: int, doc: str) -> property:
+    """Tri-state accessor for one CertBit: None when unknown, else held or not."""
+    def getter(self) -> Optional[bool]:
+        if not self.known & bit:
+            return None
+        return bool(self.mask & bit)
+    return property(getter, doc=doc)
+
+
 class CertificationInfo(BaseModel):
-    """Certification and compliance information."""
+    """Certification and compliance information.
+
+    The standard certifications are packed into two CertBit masks: ``known``
+    marks those whose status was given and ``mask`` those the module holds,
+    so "all IEC 61215 modules" is a single ``mask & CertBit.IEC_61215`` test.
+    """
 
-    iec_61215: Optional[bool] = Field(None, description="IEC 61215 certified")
-    iec_61730: Optional[bool] = Field(None, description="IEC 61730 certified")
-    ul_listed: Optional[bool] = Field(None, description="UL listed")
-    ce_marking: Optional[bool] = Field(None, description="CE marking")
-    sandia_certified: Optional[bool] = Field(None, description="Sandia certified")
+    model_config = _MODEL_CONFIG
+
+    mask: int = Field(0, description="CertBit flags of certifications held")
+    known: int = Field(0, description="CertBit flags of certifications with a known status")
 
     certifications: List[str] = Field(default_factory=list, description="Additional certifications")
 
+    iec_61215 = _cert_property(CertBit.IEC_61215, "IEC 61215 certified")
+    iec_61730 = _cert_property(CertBit.IEC_61730, "IEC 61730 certified")
+    ul_listed = _cert_property(CertBit.UL_LISTED, "UL listed")
+    ce_marking = _cert_property(CertBit.CE_MARKING, "CE marking")
+    sandia_certified = _cert_property(CertBit.SANDIA, "Sandia certified")
+
+    @model_validator(mode='before')
+    @classmethod
+    def pack_certification_flags(cls, data):
+        """Accept the per-certification boolean keywords and pack them into the masks."""
+        if isinstance(data, dict) and any(name in data for name in _CERT_BITS):
+            data = dict(data)
+            mask = data.get('mask', 0)
+            known = data.get('known', 0)
+            for name, bit in _CERT_BITS.items():
+                value = data.pop(name, None)
+                if value is not None:
+                    known |= bit
+                    if value:
+                        mask |= bit
+            data['mask'] = mask
+            data['known'] = known
+        return data
+
 
 class ManufacturerInfo(BaseModel):
     """Manufacturer information."""
 
+    model_config = _MODEL_CONFIG
+
     name: str = Field(..., description="Manufacturer name")
     model: str = Field(..., description="Model name/number")
     series: Optional[str] = Field(None, description="Product series")
@@ -158,24 +332,42 @@ class ManufacturerInfo(BaseModel):
     year: Optional[int] = Field(None, description="Year of product introduction")
     country_of_origin: Optional[str] = Field(None, description="Country of manufacture")
 
+    @validator('name', 'series', 'data_source', 'country_of_origin', pre=True)
+    def intern_repeated(cls, v):
+        return _intern(v)
+
 
 class FileMetadata(BaseModel):
     """Metadata about the .PAN file."""
 
+    model_config = _MODEL_CONFIG
+
     file_path: Path = Field(..., description="Full path to the .PAN file")
     file_name: str = Field(..., description="Name of the .PAN file")
     file_size: int = Field(..., description="File size in bytes")
     file_hash: str = Field(..., description="SHA-256 hash of the file content")
     last_modified: datetime = Field(..., description="Last modification timestamp")
-    parsed_at: datetime = Field(default_factory=datetime.now, description="When the file was parsed")
+    parsed_at: datetime = Field(default_factory=parsed_at_now, description="When the file was parsed")
     parser_version: str = Field("1.0.0", description="Version of the parser used")
 
     manufacturer_folder: Optional[str] = Field(None, description="Manufacturer folder name")
     model_folder: Optional[str] = Field(None, description="Model folder name")
 
+    @validator('manufacturer_folder', 'model_folder', pre=True)
+    def intern_repeated(cls, v):
+        return _intern(v)
+
+
+# PVModule cached_property names, cleared on copies
+_CACHED_PROPERTIES = ('unique_id', 'efficiency_stc')
+
 
 class PVModule(BaseModel):
-    """Complete PV module specification."""
+    """Complete PV module specification.
+
+    Equality is pydantic's field-by-field comparison; hashing uses only
+    ``file_metadata.file_hash``, so equal modules always hash alike.
+    """
 
     manufacturer_info: ManufacturerInfo
     electrical_params: ElectricalParameters
@@ -184,33 +376,50 @@ class PVModule(BaseModel):
     file_metadata: FileMetadata
 
     # Technical specifications
-    cell_type: CellType = Field(CellType.UNKNOWN, description="Solar cell technology")
-    module_type: ModuleType = Field(ModuleType.STANDARD, description="Module construction type")
+    cell_type: CellType = Field("unknown", description="Solar cell technology")
+    module_type: ModuleType = Field("standard", description="Module construction type")
     technology: Optional[str] = Field(None, description="Raw technology string from .pan file")
 
     # Additional metadata
     notes: Optional[str] = Field(None, description="Additional notes")
     raw_data: Dict[str, Any] = Field(default_factory=dict, description="Raw parsed data")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            Path: lambda v: str(v)
-        }
-
-    @property
+    # Frozen so a module's hash can't change while it sits in a set or dict key;
+    # unknown keys are rejected and existing instances are never revalidated.
+    # raw_data is set once at construction and not mutated afterwards.
+    model_config = ConfigDict(_MODEL_CONFIG, frozen=True, extra='forbid',
+                              revalidate_instances='never')
+
+    def __hash__(self) -> int:
+        return hash(self.file_metadata.file_hash)
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "PVModule":
+        """Copy the module; cached properties are recomputed on the copy."""
+        copy = super().model_copy(update=update, deep=deep)
+        # cached_property values live in the instance __dict__, which pydantic
+        # carries over even when `update` changes the fields they derive from
+        for name in _CACHED_PROPERTIES:
+            copy.__dict__.pop(name, None)
+        return copy
+
+    @cached_property
     def unique_id(self) -> str:
         """Generate a unique identifier for this module."""
         return f"{self.manufacturer_info.name}_{self.manufacturer_info.model}_{self.file_metadata.file_hash[:8]}"
 
-    @property
+    @cached_property
     def efficiency_stc(self) -> Optional[float]:
         """Calculate module efficiency at STC."""
         pmax = self.electrical_params.pmax_stc
         area = self.physical_params.area
+        if not area and self.physical_params.width and self.physical_params.height:
+            # Dimensions set after validation leave area unset; derive it here
+            area, _ = _derive_physical(self.physical_params.width, self.physical_params.height, None, None)
 
         if pmax and area:
-            return (pmax / (area * 1000)) * 100  # Convert to percentage
+            return _efficiency(pmax, area)
         return None
 
     @model_validator(mode='after')
@@ -218,7 +427,7 @@ class PVModule(BaseModel):
         """Set module type based on bifaciality and other properties."""
         if (self.electrical_params.bifaciality_factor and
             self.electrical_params.bifaciality_factor > 0):
-            self.module_type = ModuleType.BIFACIAL
+            object.__setattr__(self, 'module_type', "bifacial")
         return self
 
 
@@ -229,16 +438,19 @@ class ParsedFileRegistry(BaseModel):
     file_hash: str
     file_size: int
     last_modified: datetime
+    mtime_ns: Optional[int] = Field(None, description="File st_mtime_ns, for exact change checks")
     parsed_at: datetime
     parser_version: str = Field("1.0.0", description="Parser version used")
     success: bool
     error_message: Optional[str] = None
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            Path: lambda v: str(v)
-        }
+    model_config = _MODEL_CONFIG
+
+
+@cache
+def registry_adapter() -> TypeAdapter:
+    """Dict[str, ParsedFileRegistry] adapter for loading a whole registry."""
+    return TypeAdapter(Dict[str, ParsedFileRegistry])
 
 
 class ParsingResult(BaseModel):
@@ -251,8 +463,4 @@ class ParsingResult(BaseModel):
     parameters_extracted: int = 0
     parameters_missing: int = 0
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            Path: lambda v: str(v)
-        }
\ No newline at end of file
+    model_config = _MODEL_CONFIG
\ No newline at end of file
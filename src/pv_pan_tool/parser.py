@@ -6,24 +6,129 @@ photovoltaic module specifications.
 """
 
 import hashlib
-import json
+import multiprocessing
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from sys import intern
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from .models import (
-    CellType,
+    IAM_ANGLES,
     CertificationInfo,
     ElectricalParameters,
     FileMetadata,
     ManufacturerInfo,
-    ModuleType,
     ParsedFileRegistry,
     ParsingResult,
     PhysicalParameters,
     PVModule,
+    parsed_at_now,
+    parsing_session,
+    registry_adapter,
 )
+from .registry import SQLiteRegistry
+
+# Splits a comma-separated value, dropping whitespace around each item
+_COMMA_SPLIT = re.compile(r'\s*,\s*').split
+
+# .PAN field -> (PVModule section, attribute)
+FIELD_MAPPING: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    # Commercial info
+    'Manufacturer': ('manufacturer_info', 'name'),
+    'Model': ('manufacturer_info', 'model'),
+    'DataSource': ('manufacturer_info', 'data_source'),
+    'YearBeg': ('manufacturer_info', 'year'),
+    'Width': ('physical_params', 'width'),
+    'Height': ('physical_params', 'height'),
+    'Depth': ('physical_params', 'thickness'),
+    'Weight': ('physical_params', 'weight'),
+
+    # Electrical parameters
+    'NCelS': ('physical_params', 'cells_in_series'),
+    'NCelP': ('physical_params', 'cells_in_parallel'),
+    'NDiode': ('electrical_params', 'bypass_diodes'),
+    'GRef': ('electrical_params', 'g_ref'),
+    'TRef': ('electrical_params', 't_ref'),
+    'PNom': ('electrical_params', 'pmax_stc'),
+    'Isc': ('electrical_params', 'isc_stc'),
+    'Voc': ('electrical_params', 'voc_stc'),
+    'Imp': ('electrical_params', 'imp_stc'),
+    'Vmp': ('electrical_params', 'vmp_stc'),
+    'muISC': ('electrical_params', 'temp_coeff_isc'),
+    'muVocSpec': ('electrical_params', 'temp_coeff_voc'),
+    'muPmpReq': ('electrical_params', 'temp_coeff_pmax'),
+    'BifacialityFactor': ('electrical_params', 'bifaciality_factor'),
+    'RShunt': ('electrical_params', 'r_shunt'),
+    'RSerie': ('electrical_params', 'r_series'),
+    'VMaxIEC': ('electrical_params', 'max_system_voltage'),
+})
+
+# Unit conversions for consistent storage
+UNIT_CONVERSIONS: Mapping[str, float] = MappingProxyType({
+    'width': 1000,        # m to mm
+    'height': 1000,       # m to mm
+    'thickness': 1000,    # m to mm
+    'temp_coeff_voc': 0.1,  # mV/°C to %/°C
+})
+
+# Technol value -> CellType value
+TECHNOLOGY_CELL_TYPES: Mapping[str, str] = MappingProxyType({
+    "mtSiMono": "monocrystalline",
+    "mtSiPoly": "polycrystalline",
+    "mtCIS": "cigs",
+    "mtCdTe": "cdte",
+})
+
+# IAM profile point keys, and each model angle's slot in iam_values
+_IAM_POINT_KEYS = tuple(f"Point_{i}" for i in range(1, 10))
+_IAM_ANGLE_INDEX = {float(angle): i for i, angle in enumerate(IAM_ANGLES)}
+
+# ManufacturerInfo fields its intern_repeated validator interns, which
+# model_construct skips
+_INTERNED_MANUFACTURER_FIELDS = ('name', 'series', 'data_source', 'country_of_origin')
+_INTERNED_FOLDER_FIELDS = ('manufacturer_folder', 'model_folder')
+
+# Below this many files parse_directory uses threads, not worker processes:
+# each spawned worker re-imports the package before it parses anything
+PROCESS_POOL_MIN_FILES = 200
+
+# Distinct file contents whose mapped values a parser keeps for reuse; only
+# duplicates benefit, so this stays small
+CONTENT_CACHE_SIZE = 256
+
+
+@dataclass(slots=True, frozen=True)
+class _MappedContent:
+    """PVModule values that depend only on a file's content, not its path.
+
+    Holds no parse tree: cached entries would otherwise share one raw_data
+    between modules, and keep it even when raw data is not kept.
+    """
+
+    manufacturer_fields: Dict[str, Any]
+    physical_fields: Dict[str, Any]
+    electrical_fields: Dict[str, Any]
+    cell_type: str
+    technology: str
 
 
 class PANFileParser:
@@ -45,14 +150,14 @@ class PANFileParser:
     Features:
     - Automatic detection of new/changed files
     - Unit conversion (meters to mm, mV/°C to %/°C)
-    - Technology string to CellType enum mapping
+    - Technology string to CellType value mapping
     - IAM profile extraction
     - Temperature coefficient conversion
 
     Registry System:
     - Tracks processed files to avoid reprocessing
     - Uses SHA-256 hashes to detect changes
-    - Stores parsing status and errors
+    - Stores parsing status and errors, one SQLite row per file
 
     Example Usage:
     ```python
@@ -91,98 +196,108 @@ class PANFileParser:
     └── Manufacturer_B/
         └── Model_Z.pan
     """
-    FIELD_MAPPING = {
-        # Commercial info
-        'Manufacturer': ('manufacturer_info', 'name'),
-        'Model': ('manufacturer_info', 'model'),
-        'DataSource': ('manufacturer_info', 'data_source'),
-        'YearBeg': ('manufacturer_info', 'year'),
-        'Width': ('physical_params', 'width'),
-        'Height': ('physical_params', 'height'),
-        'Depth': ('physical_params', 'thickness'),
-        'Weight': ('physical_params', 'weight'),
-
-        # Electrical parameters
-        'NCelS': ('physical_params', 'cells_in_series'),
-        'NCelP': ('physical_params', 'cells_in_parallel'),
-        'NDiode': ('electrical_params', 'bypass_diodes'),
-        'GRef': ('electrical_params', 'g_ref'),
-        'TRef': ('electrical_params', 't_ref'),
-        'PNom': ('electrical_params', 'pmax_stc'),
-        'Isc': ('electrical_params', 'isc_stc'),
-        'Voc': ('electrical_params', 'voc_stc'),
-        'Imp': ('electrical_params', 'imp_stc'),
-        'Vmp': ('electrical_params', 'vmp_stc'),
-        'muISC': ('electrical_params', 'temp_coeff_isc'),
-        'muVocSpec': ('electrical_params', 'temp_coeff_voc'),
-        'muPmpReq': ('electrical_params', 'temp_coeff_pmax'),
-        'BifacialityFactor': ('electrical_params', 'bifaciality_factor'),
-        'RShunt': ('electrical_params', 'r_shunt'),
-        'RSerie': ('electrical_params', 'r_series'),
-        'VMaxIEC': ('electrical_params', 'max_system_voltage'),
-    }
+    # Read-only module tables, also reachable as class attributes
+    FIELD_MAPPING = FIELD_MAPPING
+    UNIT_CONVERSIONS = UNIT_CONVERSIONS
 
-    # Unit conversions for consistent storage
-    UNIT_CONVERSIONS = {
-        'width': 1000,        # m to mm
-        'height': 1000,       # m to mm
-        'thickness': 1000,    # m to mm
-        'temp_coeff_voc': 0.1,  # mV/°C to %/°C
-    }
-
-    def __init__(self, base_directory: str, registry_file: str = "parsed_files_registry.json"):
+    def __init__(self, base_directory: str, registry_file: Optional[str] = "parsed_files_registry.json",
+                 keep_raw_data: bool = True):
         self.base_directory = Path(base_directory)
-        self.registry_file = Path(registry_file)
-        self.registry: Dict[str, ParsedFileRegistry] = {}
+        # False leaves PVModule.raw_data empty, so parsed modules don't each hold
+        # their file's whole parsed tree; the database then stores no raw data
+        self.keep_raw_data = keep_raw_data
+        # None keeps the registry in memory only. Entries are stored in an SQLite
+        # file next to it; a JSON registry at this path is imported once.
+        self.registry_file = Path(registry_file) if registry_file is not None else None
+        self.registry: MutableMapping[str, ParsedFileRegistry] = {}
+        # path -> (mtime_ns, size, hash), so each file is hashed once per change
+        self._hash_cache: Dict[str, Tuple[int, int, str]] = {}
+        # Directory entries from the last scan, so get_new_files can reuse their stat
+        self._scan_entries: Dict[str, os.DirEntry] = {}
+        # Directory -> its folder parts below base_directory (None if outside it)
+        self._dir_parts: Dict[Path, Optional[Tuple[str, ...]]] = {}
+        # Content hash -> mapped values, so byte-identical files (the same
+        # datasheet filed under several folders) are parsed and mapped once
+        self._content_cache: Dict[str, _MappedContent] = {}
+        # Guards cache writes; parse_directory's threads share this parser
+        self._cache_lock = threading.Lock()
         self.load_registry()
 
     def load_registry(self) -> None:
-        """Load the parsed files registry from disk, if it exists."""
-        if self.registry_file.exists():
-            try:
-                with open(self.registry_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.registry = {
-                        k: ParsedFileRegistry(**v) for k, v in data.items()
-                    }
-            except Exception as e:
-                print(f"Failed to load registry: {e}")
-                self.registry = {}
-        else:
+        """Open the parsed files registry, importing a legacy JSON registry if present."""
+        if self.registry_file is None:
             self.registry = {}
-
-    def save_registry(self) -> None:
-        """Save the parsing registry to file."""
+            return
         try:
-            data = {
-                str(k): v.dict() for k, v in self.registry.items()
-            }
-            with open(self.registry_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            self.registry = SQLiteRegistry(self.registry_file.with_suffix(".sqlite"))
+            if (self.registry_file.suffix == ".json" and self.registry_file.exists()
+                    and not len(self.registry)):
+                self.registry.update_many(
+                    registry_adapter().validate_json(self.registry_file.read_bytes())
+                )
         except Exception as e:
-            print(f"Warning: Could not save registry: {e}")
+            print(f"Failed to load registry: {e}")
+            self.registry = {}
+
+    def save_registry(self) -> None:
+        """Commit registry entries recorded since the last save."""
+        if isinstance(self.registry, SQLiteRegistry):
+            try:
+                self.registry.commit()
+            except Exception as e:
+                print(f"Warning: Could not save registry: {e}")
 
     def clear_registry(self) -> None:
         """Clear the parsing registry to force re-parsing of all files."""
-        self.registry = {}
-        # Also remove the registry file if it exists
+        self.registry.clear()
+        self.save_registry()
+        # Also remove a legacy JSON registry so it isn't imported again
         try:
-            if self.registry_file.exists():
+            if (self.registry_file is not None and self.registry_file.suffix == ".json"
+                    and self.registry_file.exists()):
                 self.registry_file.unlink()
         except Exception as e:
             print(f"Warning: Could not remove registry file: {e}")
 
-    def calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA-256 hash of file content."""
-        sha256_hash = hashlib.sha256()
+    def calculate_file_hash(self, file_path: Path, stat: Optional[os.stat_result] = None) -> str:
+        """
+        Calculate SHA-256 hash of file content.
+
+        The result is cached per path and reused while the file's mtime and
+        size are unchanged; pass an already-fetched stat to skip the lookup.
+        """
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
-            return sha256_hash.hexdigest()
+            if stat is None:
+                stat = os.stat(file_path)
+            cached = self._cached_hash(file_path, stat)
+            if cached is not None:
+                return cached
+
+            # Unbuffered: file_digest reads in large chunks into its own buffer
+            with open(file_path, "rb", buffering=0) as f:
+                file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+            with self._cache_lock:
+                self._hash_cache[str(file_path)] = (stat.st_mtime_ns, stat.st_size, file_hash)
+            return file_hash
         except Exception:
             return ""
 
+    def _cached_hash(self, file_path: Path, stat: os.stat_result) -> Optional[str]:
+        """The cached hash of file_path, if it was taken at this mtime and size."""
+        cached = self._hash_cache.get(str(file_path))
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        return None
+
+    def _hash_content(self, file_path: Path, stat: os.stat_result, data: bytes) -> str:
+        """Hash already-read file content, reusing and filling the hash cache."""
+        file_hash = self._cached_hash(file_path, stat)
+        if file_hash is None:
+            file_hash = hashlib.sha256(data).hexdigest()
+            with self._cache_lock:
+                self._hash_cache[str(file_path)] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
+
     def scan_directory(self) -> List[Path]:
         """
         Scan the base directory for .PAN files.
@@ -194,10 +309,27 @@ class PANFileParser:
             print(f"Warning: Base directory does not exist: {self.base_directory}")
             return pan_files
 
-        # Search for .PAN files recursively
-        for pattern in ["**/*.pan", "**/*.PAN"]:
-            pan_files.extend(self.base_directory.glob(pattern))
-        return sorted(set(pan_files))
+        # Search for .PAN files recursively, in any letter case
+        self._scan_entries = {
+            entry.path: entry for entry in self._scandir_recursive(self.base_directory)
+            if entry.name.lower().endswith(".pan") and entry.is_file()
+        }
+        return sorted(Path(path) for path in self._scan_entries)
+
+    @staticmethod
+    def _scandir_recursive(root: Path):
+        """Yield every directory entry below root, without following directory symlinks."""
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            yield entry
+            except OSError as e:
+                print(f"Warning: Could not scan directory: {e}")
 
     def extract_manufacturer_model_from_path(self, file_path: Path) -> Tuple[str, str]:
         """
@@ -206,28 +338,28 @@ class PANFileParser:
         Returns:
             Tuple of (manufacturer, model)
         """
-        try:
-            # Get relative path from base directory
-            relative_path = file_path.relative_to(self.base_directory)
-            parts = relative_path.parts
-
-            if len(parts) >= 3:
-                # Structure: Manufacturer/Model/file.pan
-                manufacturer = parts[0]
-                model = parts[1]
-            elif len(parts) >= 2:
-                # Structure: Manufacturer/file.pan
-                manufacturer = parts[0]
-                model = file_path.stem  # Use filename without extension
-            else:
-                # Structure: file.pan
-                manufacturer = "Unknown"
-                model = file_path.stem
-
-            return manufacturer, model
-        except ValueError:
+        # Folder parts of the parent directory relative to the base directory,
+        # computed once per directory; None when it is not under the base
+        parent = file_path.parent
+        dir_parts = self._dir_parts.get(parent, False)
+        if dir_parts is False:
+            try:
+                dir_parts = parent.relative_to(self.base_directory).parts
+            except ValueError:
+                dir_parts = None
+            self._dir_parts[parent] = dir_parts
+
+        if dir_parts is None:
             # File is not under base directory
             return "Unknown", file_path.stem
+        if len(dir_parts) >= 2:
+            # Structure: Manufacturer/Model/file.pan
+            return dir_parts[0], dir_parts[1]
+        if dir_parts:
+            # Structure: Manufacturer/file.pan; use filename without extension
+            return dir_parts[0], file_path.stem
+        # Structure: file.pan
+        return "Unknown", file_path.stem
 
     def get_new_files(self, all_files: List[Path]) -> List[Path]:
         """
@@ -236,22 +368,28 @@ class PANFileParser:
             List of files that need processing
         """
         new_files = []
+        # One bulk read instead of a lookup per file
+        registry = self.registry.snapshot() if isinstance(self.registry, SQLiteRegistry) else self.registry
         for file_path in all_files:
             file_str = str(file_path)
             try:
-                # Get file stats
-                stat = file_path.stat()
-                current_size = stat.st_size
-                current_modified = datetime.fromtimestamp(stat.st_mtime)
-                current_hash = self.calculate_file_hash(file_path)
+                # Get file stats, from the scan's directory entry when there is one
+                entry = self._scan_entries.get(file_str)
+                stat = entry.stat() if entry is not None else os.stat(file_path)
 
                 # Check if file needs processing
-                if file_str in self.registry:
-                    registry_entry = self.registry[file_str]
-                    if (registry_entry.file_hash == current_hash and
-                        registry_entry.file_size == current_size and
-                        registry_entry.success):
-                        # File unchanged and previously processed successfully
+                registry_entry = registry.get(file_str)
+                if registry_entry is not None and registry_entry.success:
+                    if registry_entry.file_size != stat.st_size:
+                        pass  # Size changed: content changed, no need to hash
+                    elif _same_mtime(registry_entry, stat):
+                        # Same size and mtime: unchanged, skip without hashing
+                        continue
+                    elif registry_entry.file_hash == self.calculate_file_hash(file_path, stat):
+                        # Touched but content identical; remember the new mtime
+                        registry_entry.last_modified = datetime.fromtimestamp(stat.st_mtime)
+                        registry_entry.mtime_ns = stat.st_mtime_ns
+                        self.registry[file_str] = registry_entry
                         continue
                 new_files.append(file_path)
             except Exception as e:
@@ -260,263 +398,384 @@ class PANFileParser:
         return new_files
 
     def read_pan_file(self, file_path: Path) -> Optional[str]:
-        """Read .PAN file content with multiple encoding attempts."""
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    return f.read()
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                print(f"Error reading file {file_path}: {e}")
-                break
-        return None
+        """
+        Read .PAN file content, as UTF-8 or else Latin-1.
+
+        The file is read once; Latin-1 decodes any byte sequence, so it is the
+        fallback for files that are not valid UTF-8.
+        """
+        read = self._read_pan_bytes(file_path)
+        return _decode_pan_bytes(read[1]) if read is not None else None
+
+    def _read_pan_bytes(self, file_path: Path) -> Optional[Tuple[os.stat_result, bytes]]:
+        """Stat and read a .PAN file, or None (after reporting why) if that fails."""
+        try:
+            return file_path.stat(), file_path.read_bytes()
+        except Exception as e:
+            print(f"Error reading file {file_path}: {e}")
+            return None
 
     def parse_pan_structure(self, content: str) -> Dict[str, Any]:
         """Parse .pan file content into a structured dictionary."""
         result = {}
         stack = []
         current = result
-        lines = content.splitlines()
 
-        for line in lines:
+        for line in content.splitlines():
             stripped = line.strip()
             if not stripped:
                 continue
+            head, sep, tail = stripped.partition('=')
 
             # Handle object blocks
-            if stripped.startswith("PVObject_"):
-                parts = stripped.split('=', 1)
-                if len(parts) < 2:
+            if head.startswith("PVObject_"):
+                if not sep:
                     continue
 
-                obj_name = parts[0][9:]  # Remove "PVObject_" prefix
-                obj_type = parts[1]
-
-                new_obj = {"__type__": obj_type}
-                current[obj_name] = new_obj
+                new_obj = {"__type__": intern(tail)}
+                current[intern(head[9:])] = new_obj  # Remove "PVObject_" prefix
                 stack.append(current)
                 current = new_obj
 
-            elif stripped.startswith("End of PVObject"):
+            elif head.startswith("End of PVObject"):
                 if stack:
                     current = stack.pop()
 
             # Handle key-value pairs
-            elif '=' in stripped:
-                key, value = [part.strip() for part in stripped.split('=', 1)]
+            elif sep:
+                value = tail.lstrip()
 
                 # Handle comma-separated values (like IAM points)
-                if ',' in value:
-                    current[key] = [v.strip() for v in value.split(',')]
-                else:
-                    current[key] = value
+                # Keys repeat in every file; share one string per key across the
+                # raw_data kept on each parsed module
+                current[intern(head.rstrip())] = _COMMA_SPLIT(value) if ',' in value else value
 
         return result
 
     def parse_numeric_value(self, value: Union[str, List[str]]) -> Optional[float]:
         """Parse numeric value from string or list."""
+        if isinstance(value, list) and value:
+            value = value[0]
+        if not isinstance(value, str):
+            return None
+        # parse_pan_structure already splits on commas, so a decimal comma is
+        # rare here; only copy the string when there is one to replace
+        if ',' in value:
+            value = value.replace(',', '.')
         try:
-            if isinstance(value, list) and value:
-                return float(value[0].replace(',', '.'))
-            elif isinstance(value, str):
-                return float(value.replace(',', '.'))
-        except (ValueError, TypeError):
+            return float(value)
+        except ValueError:
             return None
-        return None
 
     def map_pan_data(self, pan_data: Dict, manufacturer: str, model: str, file_metadata: FileMetadata) -> PVModule:
-        """Map parsed .pan data to PVModule object."""
-        # Initialize objects
-        manufacturer_info = ManufacturerInfo(name=manufacturer, model=model)
-        physical_params = PhysicalParameters()
-        electrical_params = ElectricalParameters()
-        certification_info = CertificationInfo()
+        """
+        Map parsed .pan data to PVModule object.
+
+        The section models are built once at the end from collected keyword
+        arguments with model_construct: the values come from this parser and
+        were never re-validated on assignment before either.
+        """
+        return self._build_module(self._map_content(pan_data), manufacturer, model, file_metadata,
+                                  _pan_root(pan_data))
+
+    def _map_content(self, pan_data: Dict) -> _MappedContent:
+        """Collect PVModule field values from parsed .pan data."""
+        # Field values per section, keyed by model attribute
+        manufacturer_fields: Dict[str, Any] = {}
+        physical_fields: Dict[str, Any] = {}
+        electrical_fields: Dict[str, Any] = {}
 
         # Extract root object if exists
-        if "" in pan_data:
-            pan_data = pan_data[""]  # Extract root pvModule object
+        pan_data = _pan_root(pan_data)
 
         # Extract commercial info and root level parameters
         commercial = pan_data.get("Commercial", {})
 
-        # Process both commercial section and root level fields
-        data_sources = [commercial, pan_data]
-        for data_source in data_sources:
-            for pan_field, (obj_name, attr_name) in self.FIELD_MAPPING.items():
-                if pan_field in data_source:
-                    value = data_source[pan_field]
-                    # Determine target object
-                    target = None
-                    if obj_name == 'manufacturer_info':
-                        target = manufacturer_info
-                    elif obj_name == 'physical_params':
-                        target = physical_params
-                    elif obj_name == 'electrical_params':
-                        target = electrical_params
-
-                    if target:
-                        num_value = self.parse_numeric_value(value)
-                        if num_value is not None:
-                            # Apply unit conversions
-                            if attr_name in self.UNIT_CONVERSIONS:
-                                num_value *= self.UNIT_CONVERSIONS[attr_name]
-                            setattr(target, attr_name, num_value)
-                        else:
-                            setattr(target, attr_name, value)
+        # Process both commercial section and root level fields; root values
+        # are applied last and so win over the commercial section
+        targets = {
+            'manufacturer_info': manufacturer_fields,
+            'physical_params': physical_fields,
+            'electrical_params': electrical_fields,
+        }
+        for data_source in (commercial, pan_data):
+            for pan_field, value in data_source.items():
+                mapping = FIELD_MAPPING.get(pan_field)
+                if mapping is None:
+                    continue
+                obj_name, attr_name = mapping
+                num_value = self.parse_numeric_value(value)
+                if num_value is not None:
+                    # Apply unit conversions
+                    conversion = UNIT_CONVERSIONS.get(attr_name)
+                    if conversion is not None:
+                        num_value *= conversion
+                    targets[obj_name][attr_name] = num_value
+                else:
+                    targets[obj_name][attr_name] = value
 
-        # Extract IAM profile
+        for attr_name in _INTERNED_MANUFACTURER_FIELDS:
+            value = manufacturer_fields.get(attr_name)
+            if type(value) is str:
+                manufacturer_fields[attr_name] = intern(value)
+
+        # Extract IAM profile, keeping the points measured at the model's angles
         iam = pan_data.get("IAM", {})
-        for i in range(1, 10):
-            point_key = f"Point_{i}"
-            if point_key in iam:
-                try:
-                    # Extract IAM value (second value in comma-separated pair)
-                    point_value = iam[point_key]
-                    if isinstance(point_value, list):
-                        # Handle list format: [angle, iam_value]
-                        iam_value = float(point_value[1].strip())
-                    elif isinstance(point_value, str):
-                        # Handle string format: "angle, iam_value"
-                        iam_value = float(point_value.split(',')[1].strip())
-                    else:
-                        continue
-                    setattr(electrical_params, f"iam_{5*(i-1)}", iam_value)
-                except (IndexError, ValueError, TypeError):
+        iam_values: List[Optional[float]] = [None] * len(IAM_ANGLES)
+        for point_key in _IAM_POINT_KEYS:
+            point_value = iam.get(point_key)
+            if point_value is None:
+                continue
+            try:
+                if isinstance(point_value, list):
+                    # Handle list format: [angle, iam_value]
+                    angle, iam_value = point_value[0], point_value[1]
+                elif isinstance(point_value, str):
+                    # Handle string format: "angle, iam_value"
+                    angle, iam_value = point_value.split(',')[:2]
+                else:
                     continue
+                index = _IAM_ANGLE_INDEX.get(float(angle))
+                if index is not None:
+                    iam_values[index] = float(iam_value)
+            except (IndexError, ValueError, TypeError):
+                continue
+        if any(value is not None for value in iam_values):
+            electrical_fields['iam_values'] = tuple(iam_values)
 
         # Handle cell technology mapping
-        tech_map = {
-            "mtSiMono": CellType.MONOCRYSTALLINE,
-            "mtSiPoly": CellType.POLYCRYSTALLINE,
-            "mtCIS": CellType.CIGS,
-            "mtCdTe": CellType.CDTE,
-        }
         tech_str = pan_data.get("Technol", "")
-        cell_type = tech_map.get(tech_str, CellType.UNKNOWN)
+        cell_type = TECHNOLOGY_CELL_TYPES.get(tech_str, "unknown")
 
         # Handle temperature coefficient units conversion
-        if electrical_params.temp_coeff_voc and electrical_params.voc_stc:
+        temp_coeff_voc = electrical_fields.get('temp_coeff_voc')
+        voc_stc = electrical_fields.get('voc_stc')
+        if temp_coeff_voc and voc_stc:
             # Convert mV/°C to %/°C
-            electrical_params.temp_coeff_voc = (
-                electrical_params.temp_coeff_voc * 0.1 /
-                electrical_params.voc_stc
-            )
-
-        # Create PV module
+            electrical_fields['temp_coeff_voc'] = temp_coeff_voc * 0.1 / voc_stc
+
+        return _MappedContent(manufacturer_fields, physical_fields,
+                              electrical_fields, cell_type, tech_str)
+
+    def _build_module(self, content: _MappedContent, manufacturer: str, model: str,
+                      file_metadata: FileMetadata, pan_data: Dict[str, Any]) -> PVModule:
+        """Create a PVModule from mapped content, its file's path-derived values
+        and the file's own parse tree."""
+        # Folder names are the fallback for the manufacturer and model in the file
+        manufacturer_fields = {'name': intern(manufacturer), 'model': intern(model),
+                               **content.manufacturer_fields}
         return PVModule(
-            manufacturer_info=manufacturer_info,
-            electrical_params=electrical_params,
-            physical_params=physical_params,
-            certification_info=certification_info,
+            manufacturer_info=ManufacturerInfo.model_construct(**manufacturer_fields),
+            electrical_params=ElectricalParameters.model_construct(**content.electrical_fields),
+            physical_params=PhysicalParameters.model_construct(**content.physical_fields),
+            certification_info=CertificationInfo(),
             file_metadata=file_metadata,
-            cell_type=cell_type,
-            technology=tech_str,
-            raw_data=pan_data  # Store raw parsed structure
+            cell_type=content.cell_type,
+            technology=content.technology,
+            raw_data=pan_data if self.keep_raw_data else {}  # Store raw parsed structure
         )
 
-    def create_file_metadata(self, file_path: Path, manufacturer: str, model: str) -> FileMetadata:
-        """Create file metadata object."""
-        stat = file_path.stat()
+    def create_file_metadata(self, file_path: Path, manufacturer: str, model: str,
+                             file_hash: Optional[str] = None,
+                             stat: Optional[os.stat_result] = None) -> FileMetadata:
+        """Create file metadata object, reusing a hash and stat when given."""
+        if stat is None:
+            stat = file_path.stat()
+        if file_hash is None:
+            file_hash = self.calculate_file_hash(file_path, stat)
         return FileMetadata(
             file_path=file_path,
             file_name=file_path.name,
             file_size=stat.st_size,
-            file_hash=self.calculate_file_hash(file_path),
+            file_hash=file_hash,
             last_modified=datetime.fromtimestamp(stat.st_mtime),
-            parsed_at=datetime.now(),
+            parsed_at=parsed_at_now(),
             manufacturer_folder=manufacturer,
             model_folder=model
         )
 
-    def update_registry(self, file_path: Path, success: bool, error: str = "") -> None:
-        """Update parsing registry."""
-        stat = file_path.stat()
+    def update_registry(self, file_path: Path, success: bool, error: str = "",
+                        file_hash: Optional[str] = None,
+                        stat: Optional[os.stat_result] = None) -> None:
+        """Update parsing registry, reusing a hash and stat when given."""
+        if stat is None:
+            stat = file_path.stat()
+        if file_hash is None:
+            file_hash = self.calculate_file_hash(file_path, stat)
         self.registry[str(file_path)] = ParsedFileRegistry(
             file_path=file_path,
-            file_hash=self.calculate_file_hash(file_path),
+            file_hash=file_hash,
             file_size=stat.st_size,
             last_modified=datetime.fromtimestamp(stat.st_mtime),
-            parsed_at=datetime.now(),
+            mtime_ns=stat.st_mtime_ns,
+            parsed_at=parsed_at_now(),
             parser_version="1.0.0",
             success=success,
             error_message=error
         )
 
     def parse_file(self, file_path: Path) -> ParsingResult:
+        stat = file_hash = None
         try:
-            # 1. Read file content
-            content = self.read_pan_file(file_path)
-            if content is None:
+            # 1. Read file content once and hash those same bytes
+            read = self._read_pan_bytes(file_path)
+            if read is None:
                 return ParsingResult(
                     success=False,
                     error_message="Could not read file with any encoding"
                 )
-
-            # 2. Parse file structure
-            pan_data = self.parse_pan_structure(content)
-            if not pan_data:
-                return ParsingResult(
-                    success=False,
-                    error_message="Failed to parse file structure"
-                )
+            stat, data = read
+            file_hash = self._hash_content(file_path, stat, data)
+
+            # 2. Parse and map file structure; mapping is skipped when identical
+            # content was already mapped, and so is parsing unless raw data is
+            # kept (each module then gets its own tree)
+            content = self._content_cache.get(file_hash)
+            pan_data: Dict[str, Any] = {}
+            if content is None or self.keep_raw_data:
+                pan_data = self.parse_pan_structure(_decode_pan_bytes(data))
+                if not pan_data:
+                    return ParsingResult(
+                        success=False,
+                        error_message="Failed to parse file structure"
+                    )
+            if content is None:
+                content = self._map_content(pan_data)
+                with self._cache_lock:
+                    if len(self._content_cache) >= CONTENT_CACHE_SIZE:
+                        # Evict the oldest entry
+                        del self._content_cache[next(iter(self._content_cache))]
+                    self._content_cache[file_hash] = content
 
             # 3. Extract manufacturer/model from path
             manufacturer, model = self.extract_manufacturer_model_from_path(file_path)
 
-            # 4. Create file metadata
-            file_metadata = self.create_file_metadata(file_path, manufacturer, model)
+            # 4. Create file metadata; one stat and hash for metadata and registry
+            file_metadata = self.create_file_metadata(file_path, manufacturer, model, file_hash, stat)
 
-            # 5. Map to PVModule object
-            pv_module = self.map_pan_data(pan_data, manufacturer, model, file_metadata)
+            # 5. Build PVModule object
+            pv_module = self._build_module(content, manufacturer, model, file_metadata,
+                                           _pan_root(pan_data))
 
             # 6. Update registry
-            self.update_registry(file_path, True)
+            self.update_registry(file_path, True, file_hash=file_hash, stat=stat)
 
             # 7. Return successful result
             return ParsingResult(
                 success=True,
                 module=pv_module,
-                parameters_extracted=len([v for v in pv_module.dict().values() if v is not None]),
+                parameters_extracted=_count_parameters(pv_module),
                 warnings=[]  # We could add warning collection later
             )
 
         except Exception as e:
-            self.update_registry(file_path, False, str(e))
+            self.update_registry(file_path, False, str(e), file_hash=file_hash, stat=stat)
             return ParsingResult(
                 success=False,
                 error_message=str(e)
             )
 
-    def parse_directory(self, max_files: Optional[int] = None) -> Dict[str, ParsingResult]:
+    def parse_directory(
+        self, max_files: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        files: Optional[List[Path]] = None,
+        progress_callback: Optional[Callable[[int, int, Path, ParsingResult], None]] = None,
+    ) -> Dict[str, ParsingResult]:
         """
         Parse all .PAN files in the directory.
+
+        Files are parsed in parallel worker processes, or threads for small
+        batches; registry entries are still written by this process only.
+        If the worker processes fail (a crash, or a calling script without an
+        ``if __name__ == "__main__"`` guard), the files they left unparsed are
+        parsed on threads instead.
+
+        Args:
+            max_files: Maximum number of new/modified files to parse
+            max_workers: Worker count (default: number of CPUs)
+            files: Files to parse instead of the new/modified files found by
+                scanning the directory
+            progress_callback: Called as (done, total, file_path, result) each
+                time a file finishes, instead of printing progress
+
         Returns:
             Dictionary mapping file paths to parsing results
         """
-        all_files = self.scan_directory()
-        new_files = self.get_new_files(all_files)
+        if files is None:
+            all_files = self.scan_directory()
+            new_files = self.get_new_files(all_files)
+            print(f"Found {len(all_files)} total .PAN files")
+        else:
+            new_files = list(files)
 
         if max_files:
             new_files = new_files[:max_files]
 
         results = {}
-        print(f"Found {len(all_files)} total .PAN files")
-        print(f"Processing {len(new_files)} new/modified files")
-
-        for i, file_path in enumerate(new_files, 1):
-            print(f"Processing {i}/{len(new_files)}: {file_path.name}")
-            result = self.parse_file(file_path)
-            results[str(file_path)] = result
+        if progress_callback is None:
+            print(f"Processing {len(new_files)} new/modified files")
+
+        # Registry writes commit at each checkpoint instead of once per file
+        deferred = (self.registry.deferred_commits()
+                    if isinstance(self.registry, SQLiteRegistry) else nullcontext())
+
+        # All files in this run share one parsed_at timestamp, in every worker
+        with deferred, parsing_session() as parsed_at:
+            for i, (file_path, (result, entry)) in enumerate(
+                    zip(new_files, self._parse_many(new_files, parsed_at, max_workers)), 1):
+                # Reported once the file's result is in, not as it starts
+                if progress_callback is not None:
+                    progress_callback(i, len(new_files), file_path, result)
+                else:
+                    print(f"Parsed {i}/{len(new_files)}: {file_path.name}")
+                results[str(file_path)] = result
+                if entry is not None:
+                    self.registry[str(file_path)] = entry
 
-            if i % 10 == 0:  # Save registry every 10 files
-                self.save_registry()
+                if i % 10 == 0:  # Save registry every 10 files
+                    self.save_registry()
 
         # Save final registry
         self.save_registry()
         return results
 
+    def _parse_many(self, files: List[Path], parsed_at: datetime, max_workers: Optional[int]):
+        """Yield (result, registry entry) for each file, in order."""
+        cpu_count = os.cpu_count() or 1
+        workers = min(max_workers or cpu_count, len(files))
+        if len(files) < PROCESS_POOL_MIN_FILES or workers < 2 or cpu_count == 1:
+            # Not worth the process start-up, which spawning makes costly
+            yield from self._parse_in_threads(files, parsed_at, max_workers)
+            return
+
+        chunksize = max(1, len(files) // (4 * workers))
+        done = 0
+        try:
+            # Spawned, not forked: the CLI progress bar and the desktop app run
+            # threads, and forking a threaded process can deadlock the child
+            with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                for result, entry in executor.map(
+                        _parse_in_worker, [str(self.base_directory)] * len(files),
+                        [self.keep_raw_data] * len(files), [parsed_at] * len(files),
+                        files, chunksize=chunksize):
+                    if result.module is not None:
+                        # Unpickling gave each result its own copies of these strings
+                        _intern_module(result.module)
+                    done += 1
+                    yield result, entry
+        except BrokenProcessPool as e:
+            print(f"Warning: Worker processes failed ({e}); parsing the remaining files here")
+            yield from self._parse_in_threads(files[done:], parsed_at, max_workers)
+
+    def _parse_in_threads(self, files: List[Path], parsed_at: datetime, max_workers: Optional[int]):
+        """Yield (result, None) for each file; the threads share this parser directly."""
+        def parse(file_path: Path):
+            with parsing_session(parsed_at):
+                return self.parse_file(file_path), None
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            yield from executor.map(parse, files)
+
     def get_statistics(self, results: Dict[str, ParsingResult]) -> Dict[str, Union[int, float]]:
         """
         Get parsing statistics.
@@ -524,13 +783,16 @@ class PANFileParser:
             Dictionary with statistics
         """
         total_files = len(results)
-        successful = sum(1 for r in results.values() if r.success)
+        # One pass over the results for both the success count and parameter total
+        successful = 0
+        parameters_total = 0
+        for r in results.values():
+            if r.success:
+                successful += 1
+                parameters_total += r.parameters_extracted
         failed = total_files - successful
 
-        if successful > 0:
-            avg_parameters = sum(r.parameters_extracted for r in results.values() if r.success) / successful
-        else:
-            avg_parameters = 0
+        avg_parameters = parameters_total / successful if successful > 0 else 0
 
         return {
             "total_files": total_files,
@@ -538,4 +800,68 @@ class PANFileParser:
             "failed": failed,
             "success_rate": (successful / total_files * 100) if total_files > 0 else 0,
             "avg_parameters_extracted": avg_parameters
-        }
\ No newline at end of file
+        }
+
+
+def _pan_root(pan_data: Dict[str, Any]) -> Dict[str, Any]:
+    """The root pvModule object of parsed .pan data, if it has one."""
+    return pan_data.get("", pan_data)
+
+
+def _decode_pan_bytes(data: bytes) -> str:
+    """Decode .PAN content as UTF-8, or Latin-1 (which accepts any bytes)."""
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data.decode('latin-1')
+
+
+def _same_mtime(entry: ParsedFileRegistry, stat: os.stat_result) -> bool:
+    """Whether stat has the mtime recorded in a registry entry."""
+    if entry.mtime_ns is not None:
+        return entry.mtime_ns == stat.st_mtime_ns
+    # Entries recorded before mtime_ns only have the datetime
+    return entry.last_modified == datetime.fromtimestamp(stat.st_mtime)
+
+
+def _count_parameters(pv_module: PVModule) -> int:
+    """Top-level fields that are set, read directly rather than dumping the
+    module (and its whole raw_data tree) to a dict first."""
+    return sum(1 for name in PVModule.model_fields if getattr(pv_module, name) is not None)
+
+
+def _intern_tree(tree: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a parse tree with its keys and object types interned, as
+    parse_pan_structure leaves them."""
+    return {
+        intern(key): (_intern_tree(value) if isinstance(value, dict)
+                      else intern(value) if key == "__type__" else value)
+        for key, value in tree.items()
+    }
+
+
+def _intern_module(pv_module: PVModule) -> None:
+    """Intern the repeated strings of a module unpickled from a worker process."""
+    for section, names in ((pv_module.manufacturer_info, _INTERNED_MANUFACTURER_FIELDS),
+                           (pv_module.file_metadata, _INTERNED_FOLDER_FIELDS)):
+        for name in names:
+            value = getattr(section, name)
+            if type(value) is str:
+                object.__setattr__(section, name, intern(value))
+    if pv_module.raw_data:
+        object.__setattr__(pv_module, 'raw_data', _intern_tree(pv_module.raw_data))
+
+
+@cache
+def _worker_parser(base_directory: str, keep_raw_data: bool) -> PANFileParser:
+    """One in-memory-registry parser per worker process and configuration."""
+    return PANFileParser(base_directory, registry_file=None, keep_raw_data=keep_raw_data)
+
+
+def _parse_in_worker(base_directory: str, keep_raw_data: bool, parsed_at: datetime,
+                     file_path: Path) -> Tuple[ParsingResult, Optional[ParsedFileRegistry]]:
+    """Parse one file in a worker process; the caller records the registry entry."""
+    parser = _worker_parser(base_directory, keep_raw_data)
+    with parsing_session(parsed_at):
+        result = parser.parse_file(file_path)
+    return result, parser.registry.pop(str(file_path), None)
@@ -0,0 +1,196 @@
+"""
+SQLite-backed registry of parsed .PAN files.
+
+Each file's entry is one row, so recording a parse writes a single row
+instead of rewriting the whole registry.
+"""
+
+import threading
+from collections.abc import Mapping, MutableMapping
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+from .connection import open_connection
+from .models import ParsedFileRegistry
+
+REGISTRY_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
+_SQL_CREATE = """
+    CREATE TABLE IF NOT EXISTS parsed_files (
+        file_path TEXT PRIMARY KEY,
+        file_hash TEXT NOT NULL,
+        file_size INTEGER NOT NULL,
+        last_modified TEXT NOT NULL,
+        parsed_at TEXT NOT NULL,
+        parser_version TEXT NOT NULL,
+        success INTEGER NOT NULL,
+        error_message TEXT,
+        mtime_ns INTEGER
+    )
+"""
+
+_COLUMNS = ("file_path, file_hash, file_size, last_modified, parsed_at, parser_version, success, "
+            "error_message, mtime_ns")
+
+_SQL_UPSERT = f"""
+    INSERT INTO parsed_files ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(file_path) DO UPDATE SET
+        file_hash = excluded.file_hash, file_size = excluded.file_size,
+        last_modified = excluded.last_modified, parsed_at = excluded.parsed_at,
+        parser_version = excluded.parser_version, success = excluded.success,
+        error_message = excluded.error_message, mtime_ns = excluded.mtime_ns
+"""
+_SQL_SELECT = f"SELECT {_COLUMNS} FROM parsed_files WHERE file_path = ?"
+_SQL_SELECT_ALL = f"SELECT {_COLUMNS} FROM parsed_files"
+
+
+def _to_row(key: str, entry: ParsedFileRegistry) -> Tuple:
+    return (key, entry.file_hash, entry.file_size, entry.last_modified.isoformat(),
+            entry.parsed_at.isoformat(), entry.parser_version, int(entry.success),
+            entry.error_message, entry.mtime_ns)
+
+
+def _from_row(row: Tuple) -> ParsedFileRegistry:
+    # Rows were validated before they were written
+    return ParsedFileRegistry.model_construct(
+        file_path=Path(row[0]),
+        file_hash=row[1],
+        file_size=row[2],
+        last_modified=datetime.fromisoformat(row[3]),
+        parsed_at=datetime.fromisoformat(row[4]),
+        parser_version=row[5],
+        success=bool(row[6]),
+        error_message=row[7],
+        mtime_ns=row[8],
+    )
+
+
+class _LazyEntries(Mapping):
+    """Registry rows read in bulk, turned into ParsedFileRegistry on first access."""
+
+    def __init__(self, rows: Dict[str, Tuple]):
+        self._rows = rows
+        self._entries: Dict[str, ParsedFileRegistry] = {}
+
+    def __getitem__(self, key: str) -> ParsedFileRegistry:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _from_row(self._rows[key])
+        return entry
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+
+class SQLiteRegistry(MutableMapping):
+    """
+    Mapping of file path to ParsedFileRegistry, stored in SQLite.
+
+    Each write commits at once, so the database is never left write-locked
+    between parses. Inside deferred_commits() writes accumulate in one
+    transaction until commit() or the block's end, so a parse run costs one
+    row write per file and one commit per checkpoint. Safe to use from
+    several threads of one process.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        # Open deferred_commits() blocks; writes commit at once while zero
+        self._deferred = 0
+        self._conn = open_connection(self.db_path, REGISTRY_PRAGMAS)
+        self._conn.execute(_SQL_CREATE)
+        self._conn.commit()
+
+    def __getitem__(self, key: str) -> ParsedFileRegistry:
+        with self._lock:
+            row = self._conn.execute(_SQL_SELECT, (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return _from_row(row)
+
+    def __setitem__(self, key: str, entry: ParsedFileRegistry) -> None:
+        with self._lock:
+            self._conn.execute(_SQL_UPSERT, _to_row(key, entry))
+            self._commit_unless_deferred()
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if self._conn.execute("DELETE FROM parsed_files WHERE file_path = ?", (key,)).rowcount == 0:
+                raise KeyError(key)
+            self._commit_unless_deferred()
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            paths = self._conn.execute("SELECT file_path FROM parsed_files").fetchall()
+        return (path for (path,) in paths)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM parsed_files").fetchone()[0]
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM parsed_files WHERE file_path = ?", (key,)
+            ).fetchone() is not None
+
+    def snapshot(self) -> Mapping[str, ParsedFileRegistry]:
+        """
+        Every entry, read with a single query.
+
+        Rows become ParsedFileRegistry objects only when looked up, so entries
+        for files a caller never asks about cost no model construction.
+        """
+        with self._lock:
+            rows = self._conn.execute(_SQL_SELECT_ALL).fetchall()
+        return _LazyEntries({row[0]: row for row in rows})
+
+    def update_many(self, entries: Dict[str, ParsedFileRegistry]) -> None:
+        """Write many entries with one executemany."""
+        with self._lock:
+            self._conn.executemany(_SQL_UPSERT, (_to_row(k, v) for k, v in entries.items()))
+            self._commit_unless_deferred()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM parsed_files")
+            self._commit_unless_deferred()
+
+    def _commit_unless_deferred(self) -> None:
+        # Caller holds self._lock
+        if not self._deferred:
+            self._conn.commit()
+
+    @contextmanager
+    def deferred_commits(self) -> Iterator[None]:
+        """Keep writes in one transaction until commit() or the end of the block."""
+        with self._lock:
+            self._deferred += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._deferred -= 1
+                self._commit_unless_deferred()
+
+    def commit(self) -> None:
+        """Make the writes since the last commit durable."""
+        with self._lock:
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,33 @@
+"""Shared test fixtures."""
+
+import pytest
+
+PAN_TEMPLATE = """PVObject_=pvModule
+  PVObject_Commercial=pvCommercial
+    Manufacturer={manufacturer}
+    Model={model}
+    DataSource=Manufacturer
+    Width=1.134
+    Height=2.278
+  End of PVObject pvCommercial
+  Technol=mtSiMono
+  NCelS=72
+  PNom={pnom}
+  Isc=13.93
+  Voc=52.40
+  Imp=13.10
+  Vmp=40
+End of PVObject pvModule
+"""
+
+
+@pytest.fixture
+def write_pan(tmp_path):
+    """Factory writing a .PAN file at tmp_path/<folder>/<model>.PAN and returning its path."""
+    def write(folder="Jinko", model="JKM510", pnom=510, manufacturer="Jinko Solar"):
+        pan_file = tmp_path / folder / f"{model}.PAN"
+        pan_file.parent.mkdir(parents=True, exist_ok=True)
+        pan_file.write_text(PAN_TEMPLATE.format(manufacturer=manufacturer, model=model, pnom=pnom),
+                            encoding="utf-8")
+        return pan_file
+    return write
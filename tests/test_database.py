@@ -0,0 +1,89 @@
+"""Tests for PVModuleDatabase."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from pv_pan_tool.database import PVModuleDatabase
+from pv_pan_tool.parser import PANFileParser
+
+
+def test_restore_upgrades_an_old_schema_backup(tmp_path, write_pan):
+    parser = PANFileParser(str(tmp_path), registry_file=None)
+    old = PVModuleDatabase(str(tmp_path / "old.db"))
+    old.insert_module(parser.parse_file(write_pan(model="JKM510", pnom=510)).module)
+    old.close()
+    # Strip what this version added, leaving the schema older backups have
+    conn = sqlite3.connect(tmp_path / "old.db")
+    for table in ("pv_modules_stats", "pv_modules_stats_cell_type"):
+        conn.execute(f"DROP TABLE {table}")
+    conn.execute("ALTER TABLE pv_modules DROP COLUMN raw_pan_json")
+    conn.commit()
+    conn.close()
+
+    db = PVModuleDatabase(str(tmp_path / "live.db"))
+    db.restore(tmp_path / "old.db")
+
+    assert db.get_statistics()["total_modules"] == 1
+    assert db.insert_module(parser.parse_file(write_pan(model="JKM520", pnom=520)).module)
+    assert db.get_statistics()["total_modules"] == 2
+    db.close()
+
+
+def test_table_info_counts_modules_inserted_since_analyze(tmp_path, write_pan):
+    parser = PANFileParser(str(tmp_path), registry_file=None)
+    db = PVModuleDatabase(str(tmp_path / "pv.db"))
+    db.bulk_insert_from_parser_results(
+        {str(i): parser.parse_file(write_pan(model=f"JKM{500 + i}", pnom=500 + i)) for i in range(10)}
+    )
+    for pnom in (600, 610):
+        db.insert_module(parser.parse_file(write_pan(model=f"JKM{pnom}", pnom=pnom)).module)
+
+    tables = {table["name"]: table for table in db.get_table_info()}
+    assert tables["pv_modules"]["row_count"] == 12 == db.get_statistics()["total_modules"]
+    assert not tables["pv_modules"]["estimated"]
+    db.close()
+
+
+def test_bulk_insert_streams_an_iterable_in_batches(tmp_path, write_pan):
+    parser = PANFileParser(str(tmp_path), registry_file=None)
+    db = PVModuleDatabase(str(tmp_path / "pv.db"))
+    results = ((str(i), parser.parse_file(write_pan(model=f"JKM{500 + i}", pnom=500 + i)))
+               for i in range(7))
+
+    stats = db.bulk_insert_from_parser_results(results, batch_size=3)
+
+    assert stats["inserted"] == 7
+    assert db.get_statistics()["total_modules"] == 7
+    db.close()
+
+
+def test_bulk_insert_stops_reading_input_when_the_writer_fails(tmp_path, write_pan, monkeypatch):
+    parser = PANFileParser(str(tmp_path), registry_file=None)
+    result = parser.parse_file(write_pan())
+    db = PVModuleDatabase(str(tmp_path / "pv.db"))
+    failed = threading.Event()
+
+    def fail(batch, update_existing):
+        failed.set()
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(db, "_insert_result_batch", fail)
+    consumed = []
+
+    def results():
+        for i in range(100):
+            if i == 3:
+                # The first batch is with the writer; let it fail and record
+                # the error before going on
+                assert failed.wait(5)
+                time.sleep(0.1)
+            consumed.append(i)
+            yield str(i), result
+
+    with pytest.raises(RuntimeError, match="disk full"):
+        db.bulk_insert_from_parser_results(results(), batch_size=3)
+    assert len(consumed) == 4
+    db.close()
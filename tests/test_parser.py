@@ -0,0 +1,102 @@
+"""Tests for PANFileParser."""
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+from pv_pan_tool import parser as parser_module
+from pv_pan_tool.parser import PROCESS_POOL_MIN_FILES, PANFileParser
+
+
+class CrashingPool:
+    """Stands in for ProcessPoolExecutor; its workers die after `crash_after` files."""
+
+    crash_after = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, *iterables, chunksize=1):
+        for i, args in enumerate(zip(*iterables)):
+            if i == self.crash_after:
+                raise BrokenProcessPool("worker died")
+            yield fn(*args)
+
+
+def test_manufacturer_strings_are_shared_across_files(tmp_path, write_pan):
+    parser = PANFileParser(str(tmp_path), registry_file=None)
+    a = parser.parse_file(write_pan("Jinko", "JKM510", 510)).module
+    b = parser.parse_file(write_pan("Jinko", "JKM520", 520)).module
+
+    assert a.manufacturer_info.name == "Jinko Solar"
+    assert a.manufacturer_info.name is b.manufacturer_info.name
+    assert a.manufacturer_info.data_source is b.manufacturer_info.data_source
+    assert a.file_metadata.manufacturer_folder is b.file_metadata.manufacturer_folder
+
+
+def test_worker_process_results_share_strings(tmp_path, write_pan, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    files = [write_pan("Jinko/Tiger", f"JKM{pnom}", pnom)
+             for pnom in range(500, 500 + PROCESS_POOL_MIN_FILES)]
+    parser = PANFileParser(str(tmp_path), registry_file=None)
+
+    results = parser.parse_directory(files=files, max_workers=2, progress_callback=lambda *args: None)
+
+    modules = [results[str(pan_file)].module for pan_file in files]
+    assert len({id(module.manufacturer_info.name) for module in modules}) == 1
+    assert len({id(module.file_metadata.manufacturer_folder) for module in modules}) == 1
+    assert len({id(module.file_metadata.model_folder) for module in modules}) == 1
+    assert len({id(next(iter(module.raw_data))) for module in modules}) == 1
+    # Worker registry entries are recorded by this process
+    assert set(parser.registry) == {str(pan_file) for pan_file in files}
+
+
+def test_identical_files_in_different_folders_are_not_equal(tmp_path, write_pan):
+    parser = PANFileParser(str(tmp_path), registry_file=None)
+    a = parser.parse_file(write_pan("Jinko", "JKM510", 510)).module
+    dup = parser.parse_file(write_pan("Jinko_copy", "JKM510", 510)).module
+
+    assert a.file_metadata.file_hash == dup.file_metadata.file_hash
+    assert a != dup
+    assert a == a.model_copy()
+    assert hash(a) == hash(a.model_copy())
+
+
+def test_duplicate_content_gets_its_own_raw_data(tmp_path, write_pan):
+    parser = PANFileParser(str(tmp_path), registry_file=None)
+    a = parser.parse_file(write_pan("Jinko", "JKM510", 510)).module
+    dup = parser.parse_file(write_pan("Jinko_copy", "JKM510", 510)).module
+
+    assert a.raw_data == dup.raw_data
+    assert a.raw_data["Commercial"] is not dup.raw_data["Commercial"]
+    assert dup.electrical_params == a.electrical_params
+
+
+def test_files_left_by_a_crashed_pool_are_parsed_on_threads(tmp_path, write_pan, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(CrashingPool, "crash_after", 3)
+    monkeypatch.setattr(parser_module, "ProcessPoolExecutor", CrashingPool)
+    files = [write_pan("Jinko", f"JKM{pnom}", pnom) for pnom in range(500, 500 + PROCESS_POOL_MIN_FILES)]
+    parser = PANFileParser(str(tmp_path), registry_file=None)
+
+    results = parser.parse_directory(files=files, progress_callback=lambda *args: None)
+
+    assert list(results) == [str(pan_file) for pan_file in files]
+    assert all(result.success for result in results.values())
+    assert set(parser.registry) == {str(pan_file) for pan_file in files}
+
+
+def test_single_cpu_never_starts_worker_processes(tmp_path, write_pan, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(parser_module, "ProcessPoolExecutor", None)
+    files = [write_pan("Jinko", f"JKM{pnom}", pnom) for pnom in range(500, 500 + PROCESS_POOL_MIN_FILES)]
+    parser = PANFileParser(str(tmp_path), registry_file=None)
+
+    results = parser.parse_directory(files=files, max_workers=4, progress_callback=lambda *args: None)
+
+    assert all(result.success for result in results.values())
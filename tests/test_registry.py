@@ -0,0 +1,98 @@
+"""Tests for the SQLite parsed-files registry."""
+
+import json
+import sqlite3
+from datetime import datetime
+
+from pv_pan_tool.models import ParsedFileRegistry
+from pv_pan_tool.parser import PANFileParser
+from pv_pan_tool.registry import SQLiteRegistry
+
+
+def legacy_entry(pan_file, file_hash):
+    """A registry entry as the JSON registry stored it (json.dump, default=str)."""
+    stat = pan_file.stat()
+    return {
+        "file_path": str(pan_file),
+        "file_hash": file_hash,
+        "file_size": stat.st_size,
+        "last_modified": str(datetime.fromtimestamp(stat.st_mtime)),
+        "parsed_at": str(datetime(2024, 1, 1, 12, 0)),
+        "parser_version": "1.0.0",
+        "success": True,
+        "error_message": None,
+    }
+
+
+def test_legacy_json_registry_is_imported(tmp_path, write_pan):
+    pan_file = write_pan()
+    file_hash = PANFileParser(str(tmp_path), registry_file=None).calculate_file_hash(pan_file)
+    registry_file = tmp_path / "registry.json"
+    registry_file.write_text(json.dumps({str(pan_file): legacy_entry(pan_file, file_hash)}))
+
+    parser = PANFileParser(str(tmp_path), registry_file=str(registry_file))
+
+    assert isinstance(parser.registry, SQLiteRegistry)
+    entry = parser.registry[str(pan_file)]
+    assert entry.file_hash == file_hash
+    assert entry.parsed_at == datetime(2024, 1, 1, 12, 0)
+    assert entry.mtime_ns is None
+    # The imported entry still marks the unchanged file as parsed
+    assert parser.get_new_files(parser.scan_directory()) == []
+    parser.registry.close()
+
+    # The import is committed and not repeated on the next open
+    registry_file.write_text("{}")
+    reopened = PANFileParser(str(tmp_path), registry_file=str(registry_file))
+    assert list(reopened.registry) == [str(pan_file)]
+    reopened.registry.close()
+
+
+def test_clear_registry_removes_legacy_json(tmp_path, write_pan):
+    pan_file = write_pan()
+    registry_file = tmp_path / "registry.json"
+    registry_file.write_text(json.dumps({str(pan_file): legacy_entry(pan_file, "abc")}))
+
+    parser = PANFileParser(str(tmp_path), registry_file=str(registry_file))
+    parser.clear_registry()
+
+    assert len(parser.registry) == 0
+    assert not registry_file.exists()
+    parser.registry.close()
+
+
+def test_parse_file_commits_registry_entry(tmp_path, write_pan):
+    pan_file = write_pan()
+    parser = PANFileParser(str(tmp_path), registry_file=str(tmp_path / "registry.json"))
+
+    assert parser.parse_file(pan_file).success
+
+    # Visible to, and not write-locked against, another connection
+    conn = sqlite3.connect(tmp_path / "registry.sqlite", timeout=0)
+    try:
+        assert conn.execute("SELECT success FROM parsed_files WHERE file_path = ?",
+                            (str(pan_file),)).fetchone() == (1,)
+        conn.execute("BEGIN IMMEDIATE")
+        conn.rollback()
+    finally:
+        conn.close()
+    parser.registry.close()
+
+
+def test_deferred_commits_hold_writes_until_the_block_ends(tmp_path, write_pan):
+    pan_file = write_pan()
+    registry = SQLiteRegistry(tmp_path / "registry.sqlite")
+    entry = ParsedFileRegistry.model_validate(legacy_entry(pan_file, "abc"))
+
+    def committed_rows():
+        conn = sqlite3.connect(tmp_path / "registry.sqlite")
+        try:
+            return conn.execute("SELECT COUNT(*) FROM parsed_files").fetchone()[0]
+        finally:
+            conn.close()
+
+    with registry.deferred_commits():
+        registry[str(pan_file)] = entry
+        assert committed_rows() == 0
+    assert committed_rows() == 1
+    registry.close()